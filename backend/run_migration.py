@@ -1,11 +1,29 @@
 """
 Database migration runner script.
 Executes SQL migration files against the Neon PostgreSQL database.
+
+Uses psycopg (psycopg3) for native binary protocol and server-side parameter
+binding. For bulk seed data, prefer COPY via cursor.copy() over many INSERTs,
+and conn.pipeline() to batch parameterized statements into fewer round-trips.
 """
-import psycopg2
+import psycopg
 from src.core.config import settings
 import sys
 
+
+def get_connection_url() -> str:
+    """
+    Normalize the configured DATABASE_URL for psycopg.
+
+    psycopg accepts plain postgresql:// URLs directly; strip any
+    SQLAlchemy-style driver suffix (e.g. postgresql+psycopg2://).
+    """
+    url = settings.DATABASE_URL
+    if url.startswith("postgresql+"):
+        url = "postgresql://" + url.split("://", 1)[1]
+    return url
+
+
 def run_migration(sql_file_path: str):
     """
     Execute a SQL migration file against the database.
@@ -14,33 +32,28 @@ def run_migration(sql_file_path: str):
         sql_file_path: Path to the SQL migration file
     """
     try:
-        # Connect to database
+        # Connect to database (autocommit so DDL applies immediately)
         print(f"Connecting to database...")
-        conn = psycopg2.connect(settings.DATABASE_URL)
-        conn.autocommit = True
-        cursor = conn.cursor()
-
-        # Read migration file
-        print(f"Reading migration file: {sql_file_path}")
-        with open(sql_file_path, 'r') as f:
-            sql = f.read()
-
-        # Execute migration
-        print(f"Executing migration...")
-        cursor.execute(sql)
-
-        # Fetch and display results if any
-        if cursor.description:
-            results = cursor.fetchall()
-            if results:
-                print("\nMigration verification results:")
-                for row in results:
-                    print(f"  {row}")
+        with psycopg.connect(get_connection_url(), autocommit=True) as conn:
+            with conn.cursor() as cursor:
+                # Read migration file
+                print(f"Reading migration file: {sql_file_path}")
+                with open(sql_file_path, 'r') as f:
+                    sql = f.read()
 
-        print("\n[SUCCESS] Migration completed successfully!")
+                # Execute migration
+                print(f"Executing migration...")
+                cursor.execute(sql)
 
-        cursor.close()
-        conn.close()
+                # Fetch and display results if any
+                if cursor.description:
+                    results = cursor.fetchall()
+                    if results:
+                        print("\nMigration verification results:")
+                        for row in results:
+                            print(f"  {row}")
+
+        print("\n[SUCCESS] Migration completed successfully!")
 
     except Exception as e:
         print(f"\n[ERROR] Migration failed: {e}")
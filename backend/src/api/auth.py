@@ -1,13 +1,19 @@
 from fastapi import APIRouter, Depends, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel
+import asyncio
 import logging
 
 from ..core.exceptions import ValidationError
-from ..db.connection import get_session
+from ..db.connection import SessionDep
 from ..models.user import UserCreate, UserLogin, UserResponse
 from ..services.user_service import create_user
-from ..services.auth_service import authenticate_user, refresh_access_token
+from ..services.auth_service import (
+    authenticate_user,
+    create_access_token,
+    create_refresh_token,
+    refresh_access_token,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -52,7 +58,7 @@ class RefreshTokenResponse(BaseModel):
 )
 async def register(
     user_data: UserCreate,
-    session: Session = Depends(get_session),
+    session: SessionDep,
 ):
     """
     Register a new user account and return authentication tokens.
@@ -70,22 +76,24 @@ async def register(
 
     After successful registration, returns authentication tokens to auto-login the user.
     """
-    logger.info(f"Registration endpoint hit for email: {user_data.email}")
+    logger.info("Registration endpoint hit for email: %s", user_data.email)
     
     try:
         # Create the user
         logger.info("Calling create_user function")
         user = await create_user(session, user_data)
-        logger.info(f"User creation returned: {user.id if user else 'None'}")
+        logger.info("User creation returned: %s", user.id if user else 'None')
 
         # After successful registration, create and return authentication tokens
-        # This provides a seamless experience for the user
-        from ..services.auth_service import create_access_token, create_refresh_token
-
-        access_token = create_access_token(user.id)
-        refresh_token = create_refresh_token(user.id)
+        # This provides a seamless experience for the user.
+        # The two signings are independent, so run them concurrently off the
+        # event loop instead of back-to-back inline.
+        access_token, refresh_token = await asyncio.gather(
+            asyncio.to_thread(create_access_token, user.id),
+            asyncio.to_thread(create_refresh_token, user.id),
+        )
 
-        logger.info(f"User registered and tokens generated successfully: {user.id}")
+        logger.info("User registered and tokens generated successfully: %s", user.id)
 
         return {
             "access_token": access_token,
@@ -94,11 +102,11 @@ async def register(
             "user_id": user.id
         }
     except ValidationError as ve:
-        logger.error(f"Validation error during registration: {ve}")
+        logger.error("Validation error during registration: %s", ve)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during registration: {e}")
-        session.rollback()  # Ensure rollback on error
+        logger.error("Unexpected error during registration: %s", e)
+        await session.rollback()  # Ensure rollback on error
         raise
 
 
@@ -114,7 +122,7 @@ async def register(
 )
 async def login(
     login_data: UserLogin,
-    session: Session = Depends(get_session),
+    session: SessionDep,
 ):
     """
     Login user and return JWT tokens.
@@ -136,7 +144,7 @@ async def login(
     2. When access_token expires, use refresh_token at /auth/refresh to get new access_token
     3. Store refresh_token securely (httpOnly cookie recommended for web apps)
     """
-    logger.info(f"Login attempt for email: {login_data.email}")
+    logger.info("Login attempt for email: %s", login_data.email)
     result = await authenticate_user(session, login_data)
     return result
 
@@ -153,7 +161,7 @@ async def login(
 )
 async def refresh_token(
     request: RefreshTokenRequest,
-    session: Session = Depends(get_session),
+    session: SessionDep,
 ):
     """
     Refresh access token using a valid refresh token.
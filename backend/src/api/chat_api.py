@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlmodel.ext.asyncio.session import AsyncSession
 import logging
-from typing import Dict, Any
+import re
 import asyncio
 import json
 
-from ..db.connection import get_session
-from ..middleware.auth import get_current_user
+from ..db.connection import session_scope
+from ..middleware.auth import UserDep
 from ..services.conversation_service import create_conversation, create_message, get_messages
 from ..models.mcp_models import MessageRequest, MessageResponse
 
@@ -25,6 +27,29 @@ from ..models.mcp_models import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Compiled once at import: the handlers run these per chat message, and
+# inline re.search rebuilds the pattern string and goes through the regex
+# cache lookup on every call.
+_TASK_ID_RE = re.compile(r'task\s+(\d+)')
+_ADD_TITLE_RE = re.compile(r'(?:add|create|make)\s+(?:a\s+)?(.+?)(?:\s+to\s+my\s+tasks?|$)')
+_ADD_TITLE_FALLBACK_RE = re.compile(r'(?:add|create|make)\s+(.+)')
+_UPDATE_TITLE_RE = re.compile(r'(?:update|change|modify|edit)\s+task\s+\d+\s+(?:to|with|as)\s+(.+?)(?:\.|$)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class ChatRequest(BaseModel):
+    """Request model for the chat endpoint."""
+    message: str = Field(
+        ...,
+        min_length=1,
+        max_length=2000,
+        description="Natural language message for the AI agent",
+    )
+    stream: bool = Field(
+        False,
+        description="Stream the response as plain-text chunks instead of buffering a JSON body",
+    )
+
 
 class SimpleAIProcessor:
     """
@@ -32,52 +57,64 @@ class SimpleAIProcessor:
     In a real implementation, this would connect to an LLM service like OpenAI.
     """
     
+    # Keyword lists per intent, checked in priority order
+    tool_keywords = {
+        'add': ['add', 'create', 'make', 'new'],
+        'list': ['list', 'show', 'view', 'see', 'display'],
+        'complete': ['complete', 'finish', 'done', 'mark'],
+        'delete': ['delete', 'remove', 'cancel'],
+        'update': ['update', 'change', 'modify', 'edit']
+    }
+
     def __init__(self):
-        self.tool_keywords = {
-            'add': ['add', 'create', 'make', 'new'],
-            'list': ['list', 'show', 'view', 'see', 'display'],
-            'complete': ['complete', 'finish', 'done', 'mark'],
-            'delete': ['delete', 'remove', 'cancel'],
-            'update': ['update', 'change', 'modify', 'edit']
+        # PERFORMANCE: compile one alternation regex per intent instead of
+        # scanning the message once per keyword with `any(kw in message ...)`.
+        # Each regex is a single pass over the message; the compiled patterns
+        # are built once for the processor's lifetime.
+        self.intent_patterns = [
+            (intent, re.compile(r'\b(?:' + '|'.join(keywords) + r')\b'))
+            for intent, keywords in self.tool_keywords.items()
+        ]
+        # Dispatch table built once per processor: intent name -> bound
+        # handler. Keeps process_message to a table lookup instead of an
+        # if/elif chain rebuilt logic on every request.
+        self.intent_handlers = {
+            'add': self.handle_add_task,
+            'list': self.handle_list_tasks,
+            'complete': self.handle_complete_task,
+            'delete': self.handle_delete_task,
+            'update': self.handle_update_task,
         }
-    
-    async def process_message(self, message: str, user_id: int, session: Session) -> str:
+
+    async def process_message(self, message: str, user_id: int, session: AsyncSession) -> str:
         """
         Process a natural language message and call appropriate MCP tools.
         """
         message_lower = message.lower()
-        
-        # Determine which tool to call based on keywords
-        if any(keyword in message_lower for keyword in self.tool_keywords['add']):
-            return await self.handle_add_task(message, user_id, session)
-        elif any(keyword in message_lower for keyword in self.tool_keywords['list']):
-            return await self.handle_list_tasks(message, user_id, session)
-        elif any(keyword in message_lower for keyword in self.tool_keywords['complete']):
-            return await self.handle_complete_task(message, user_id, session)
-        elif any(keyword in message_lower for keyword in self.tool_keywords['delete']):
-            return await self.handle_delete_task(message, user_id, session)
-        elif any(keyword in message_lower for keyword in self.tool_keywords['update']):
-            return await self.handle_update_task(message, user_id, session)
-        else:
-            # Default response if no specific action is detected
-            return f"I understood your message: '{message}'. How can I help you with your tasks?"
+
+        # Determine which tool to call based on keywords (priority order)
+        for intent, pattern in self.intent_patterns:
+            if pattern.search(message_lower):
+                handler = self.intent_handlers[intent]
+                return await handler(message, message_lower, user_id, session)
+
+        # Default response if no specific action is detected
+        return f"I understood your message: '{message}'. How can I help you with your tasks?"
     
-    async def handle_add_task(self, message: str, user_id: int, session: Session) -> str:
+    async def handle_add_task(self, message: str, message_lower: str, user_id: int, session: AsyncSession) -> str:
         """
         Extract task details from message and call add_task tool.
         """
         # Simple extraction - in a real implementation, this would use NLP
-        import re
-        
         # Look for task title in the message (everything after common phrases)
-        title_match = re.search(r'(?:add|create|make)\s+(?:a\s+)?(.+?)(?:\s+to\s+my\s+tasks?|$)', message_lower)
+        title_match = _ADD_TITLE_RE.search(message_lower)
         if not title_match:
-            title_match = re.search(r'(?:add|create|make)\s+(.+)', message_lower)
+            title_match = _ADD_TITLE_FALLBACK_RE.search(message_lower)
         
         if title_match:
             title = title_match.group(1).strip()
             # Clean up the title
-            title = re.sub(r'\s+', ' ', title)  # Replace multiple spaces with single space
+            title = _WHITESPACE_RE.sub(' ', title)  # Replace multiple spaces with single space
         else:
             title = "New task"  # Default title if none found
         
@@ -96,7 +133,7 @@ class SimpleAIProcessor:
         else:
             return f"Sorry, I couldn't add the task: {response.error_message}"
     
-    async def handle_list_tasks(self, message: str, user_id: int, session: Session) -> str:
+    async def handle_list_tasks(self, message: str, message_lower: str, user_id: int, session: AsyncSession) -> str:
         """
         Call list_tasks tool and format the response.
         """
@@ -116,24 +153,23 @@ class SimpleAIProcessor:
         if response.success:
             if not response.tasks:
                 return "You don't have any tasks right now."
-            
-            task_list = []
-            for task in response.tasks:
-                status = "✓" if task.get('is_complete', False) else "○"
-                task_list.append(f"{status} {task['title']}")
-            
-            return f"Here are your tasks:\n" + "\n".join([f"- {task}" for task in task_list])
+
+            # Single pass: format each task once and join, instead of
+            # building an intermediate list and re-iterating it to add
+            # the "- " prefix.
+            return "Here are your tasks:\n" + "\n".join(
+                f"- {'✓' if task.is_complete else '○'} {task.title}"
+                for task in response.tasks
+            )
         else:
             return f"Sorry, I couldn't retrieve your tasks: {response.error_message}"
     
-    async def handle_complete_task(self, message: str, user_id: int, session: Session) -> str:
+    async def handle_complete_task(self, message: str, message_lower: str, user_id: int, session: AsyncSession) -> str:
         """
         Extract task ID and call complete_task tool.
         """
-        import re
-        
         # Try to extract task ID from message
-        task_id_match = re.search(r'task\s+(\d+)', message_lower)
+        task_id_match = _TASK_ID_RE.search(message_lower)
         if not task_id_match:
             # If no specific task ID, try to find by title
             return "Please specify which task you want to mark as complete by its number or title."
@@ -158,14 +194,12 @@ class SimpleAIProcessor:
         except ValueError:
             return "Invalid task number. Please specify a valid task number."
     
-    async def handle_delete_task(self, message: str, user_id: int, session: Session) -> str:
+    async def handle_delete_task(self, message: str, message_lower: str, user_id: int, session: AsyncSession) -> str:
         """
         Extract task ID and call delete_task tool.
         """
-        import re
-        
         # Try to extract task ID from message
-        task_id_match = re.search(r'task\s+(\d+)', message_lower)
+        task_id_match = _TASK_ID_RE.search(message_lower)
         if not task_id_match:
             return "Please specify which task you want to delete by its number."
         
@@ -188,14 +222,12 @@ class SimpleAIProcessor:
         except ValueError:
             return "Invalid task number. Please specify a valid task number."
     
-    async def handle_update_task(self, message: str, user_id: int, session: Session) -> str:
+    async def handle_update_task(self, message: str, message_lower: str, user_id: int, session: AsyncSession) -> str:
         """
         Extract task details and call update_task tool.
         """
-        import re
-        
         # Extract task ID and what to update
-        task_id_match = re.search(r'task\s+(\d+)', message_lower)
+        task_id_match = _TASK_ID_RE.search(message_lower)
         if not task_id_match:
             return "Please specify which task you want to update by its number."
         
@@ -203,7 +235,7 @@ class SimpleAIProcessor:
             task_id = int(task_id_match.group(1))
             
             # For now, just update the title if mentioned
-            title_match = re.search(r'(?:update|change|modify|edit)\s+task\s+\d+\s+(?:to|with|as)\s+(.+?)(?:\.|$)', message_lower)
+            title_match = _UPDATE_TITLE_RE.search(message_lower)
             if not title_match:
                 return "Please specify what you want to update in the task."
             
@@ -243,9 +275,8 @@ ai_processor = SimpleAIProcessor()
 )
 async def chat_with_ai(
     user_id: int,
-    message_data: Dict[str, Any],  # Using Dict since we don't have a specific request model
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    message_data: ChatRequest,
+    current_user_id: UserDep,
 ):
     """
     Send a message to the AI agent and receive a response.
@@ -257,25 +288,37 @@ async def chat_with_ai(
     if user_id != current_user_id:
         raise HTTPException(status_code=403, detail="Forbidden: User ID mismatch")
     
-    # Extract message content from the request
-    message_content = message_data.get("message", "")
-    if not message_content:
-        raise HTTPException(status_code=400, detail="Message content is required")
-    
-    logger.info(f"User {user_id} sent message: {message_content}")
+    # Message presence/length is enforced by ChatRequest validation
+    message_content = message_data.message
     
+    logger.info("User %s sent message: %s", user_id, message_content)
+
     try:
-        # Process the message with the AI agent
-        ai_response = await ai_processor.process_message(message_content, user_id, session)
-        
+        # Open the database session only after auth and validation passed,
+        # so rejected requests never check out a connection from the pool.
+        async with session_scope() as session:
+            # Process the message with the AI agent
+            ai_response = await ai_processor.process_message(message_content, user_id, session)
+
         # Log the response
-        logger.info(f"AI response for user {user_id}: {ai_response}")
-        
+        logger.info("AI response for user %s: %s", user_id, ai_response)
+
+        if message_data.stream:
+            # Stream the response in chunks so clients can render
+            # incrementally instead of waiting for the full buffered body.
+            def iter_chunks(text: str, size: int = 256):
+                for start in range(0, len(text), size):
+                    yield text[start:start + size]
+
+            return StreamingResponse(
+                iter_chunks(ai_response), media_type="text/plain; charset=utf-8"
+            )
+
         return {
             "success": True,
             "response": ai_response,
             "user_id": user_id
         }
     except Exception as e:
-        logger.error(f"Error processing AI message: {str(e)}")
+        logger.error("Error processing AI message: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, status
-from sqlmodel import Session
-from typing import List
+from fastapi import APIRouter, Query, Response, status
+from datetime import datetime
+from typing import List, Optional
 import logging
-from ..db.connection import get_session
+from ..db.connection import SessionDep, ReadOnlySessionDep
 from ..models.task import TaskCreate, TaskUpdate, TaskResponse
 from ..services.task_service import (
     create_task,
@@ -12,7 +12,7 @@ from ..services.task_service import (
     delete_task,
     toggle_complete,
 )
-from ..middleware.auth import get_current_user
+from ..middleware.auth import UserDep
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -32,8 +32,8 @@ logger = logging.getLogger(__name__)
 )
 async def create_task_endpoint(
     task_data: TaskCreate,
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: SessionDep,
+    current_user_id: UserDep,
 ):
     """
     Create a new task for the authenticated user.
@@ -44,10 +44,10 @@ async def create_task_endpoint(
 
     Requires JWT authentication via Authorization: Bearer <token> header.
     """
-    logger.info(f"User {current_user_id} creating new task: {task_data.title}")
+    logger.info("User %s creating new task: %s", current_user_id, task_data.title)
     task = await create_task(session, task_data, current_user_id)
-    logger.info(f"Task {task.id} created successfully for user {current_user_id}")
-    return TaskResponse.model_validate(task)
+    logger.info("Task %s created successfully for user %s", task.id, current_user_id)
+    return task
 
 
 @router.get(
@@ -61,19 +61,36 @@ async def create_task_endpoint(
     },
 )
 async def get_tasks_endpoint(
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: ReadOnlySessionDep,
+    current_user_id: UserDep,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=100),
+    after_created_at: Optional[datetime] = Query(default=None),
+    after_id: Optional[int] = Query(default=None),
 ):
     """
-    Get all tasks for the authenticated user.
+    Get tasks for the authenticated user, ordered by creation date (newest first).
+
+    Pages are fetched with a keyset cursor: repeat the request with the
+    `after_created_at` and `after_id` values from the X-Next-Cursor
+    response header (format: `<created_at>,<id>`) to get the next page.
+    The header is omitted on the last page.
 
-    Returns tasks ordered by creation date (newest first).
     Requires JWT authentication via Authorization: Bearer <token> header.
     """
-    logger.info(f"User {current_user_id} retrieving all tasks")
-    tasks = await get_tasks(session, current_user_id, include_completed=True)
-    logger.info(f"Retrieved {len(tasks)} tasks for user {current_user_id}")
-    return [TaskResponse.model_validate(task) for task in tasks]
+    logger.info("User %s retrieving tasks", current_user_id)
+    after = None
+    if after_created_at is not None and after_id is not None:
+        after = (after_created_at, after_id)
+    tasks = await get_tasks(session, current_user_id, include_completed=True, limit=limit, after=after)
+    if len(tasks) == limit:
+        last = tasks[-1]
+        response.headers["X-Next-Cursor"] = f"{last.created_at.isoformat()},{last.id}"
+    logger.info("Retrieved %s tasks for user %s", len(tasks), current_user_id)
+    # PERFORMANCE: return ORM objects directly; FastAPI validates the batch
+    # against response_model in one pass. The previous per-item
+    # model_validate meant every task was validated twice per request.
+    return tasks
 
 
 @router.get(
@@ -90,8 +107,8 @@ async def get_tasks_endpoint(
 )
 async def get_task_endpoint(
     task_id: int,
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: ReadOnlySessionDep,
+    current_user_id: UserDep,
 ):
     """
     Get a specific task by ID.
@@ -101,9 +118,9 @@ async def get_task_endpoint(
     Requires JWT authentication via Authorization: Bearer <token> header.
     User must own the task.
     """
-    logger.info(f"User {current_user_id} retrieving task {task_id}")
+    logger.info("User %s retrieving task %s", current_user_id, task_id)
     task = await get_task_by_id(session, task_id, current_user_id)
-    return TaskResponse.model_validate(task)
+    return task
 
 
 @router.put(
@@ -122,8 +139,8 @@ async def get_task_endpoint(
 async def update_task_endpoint(
     task_id: int,
     task_data: TaskUpdate,
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: SessionDep,
+    current_user_id: UserDep,
 ):
     """
     Update a task. Only provided fields will be updated.
@@ -137,10 +154,10 @@ async def update_task_endpoint(
     Requires JWT authentication via Authorization: Bearer <token> header.
     User must own the task.
     """
-    logger.info(f"User {current_user_id} updating task {task_id}")
+    logger.info("User %s updating task %s", current_user_id, task_id)
     task = await update_task(session, task_id, task_data, current_user_id)
-    logger.info(f"Task {task_id} updated successfully")
-    return TaskResponse.model_validate(task)
+    logger.info("Task %s updated successfully", task_id)
+    return task
 
 
 @router.delete(
@@ -157,8 +174,8 @@ async def update_task_endpoint(
 )
 async def delete_task_endpoint(
     task_id: int,
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: SessionDep,
+    current_user_id: UserDep,
 ):
     """
     Delete a task permanently.
@@ -168,9 +185,9 @@ async def delete_task_endpoint(
     Requires JWT authentication via Authorization: Bearer <token> header.
     User must own the task. This action cannot be undone.
     """
-    logger.info(f"User {current_user_id} deleting task {task_id}")
+    logger.info("User %s deleting task %s", current_user_id, task_id)
     await delete_task(session, task_id, current_user_id)
-    logger.info(f"Task {task_id} deleted successfully")
+    logger.info("Task %s deleted successfully", task_id)
     return None
 
 
@@ -188,8 +205,8 @@ async def delete_task_endpoint(
 )
 async def toggle_complete_endpoint(
     task_id: int,
-    session: Session = Depends(get_session),
-    current_user_id: int = Depends(get_current_user),
+    session: SessionDep,
+    current_user_id: UserDep,
 ):
     """
     Toggle task completion status.
@@ -202,7 +219,7 @@ async def toggle_complete_endpoint(
     Requires JWT authentication via Authorization: Bearer <token> header.
     User must own the task.
     """
-    logger.info(f"User {current_user_id} toggling completion for task {task_id}")
+    logger.info("User %s toggling completion for task %s", current_user_id, task_id)
     task = await toggle_complete(session, task_id, current_user_id)
-    logger.info(f"Task {task_id} completion toggled to {task.is_complete}")
-    return TaskResponse.model_validate(task)
+    logger.info("Task %s completion toggled to %s", task_id, task.is_complete)
+    return task
@@ -1,4 +1,6 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -11,10 +13,32 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DATABASE_ECHO: bool = False  # Set to True for SQL query logging in development
+    # PERFORMANCE: when enabled, liveness is checked by a throttled
+    # engine_connect listener (one SELECT 1 per connection per 30s) rather
+    # than pool_pre_ping's per-checkout SELECT 1, which PgBouncer
+    # (transaction mode) holds as an open transaction. Keep this off against
+    # the -pooler endpoint; enable only for direct (non-pooler) endpoints.
+    DB_POOL_PRE_PING: bool = False
+    # Connection pool sizing. Neon's PgBouncer caps each role at 64 server
+    # connections, shared by every uvicorn worker. DB_POOL_SIZE=0 means
+    # "auto": derive a per-worker budget from that cap and API_WORKERS.
+    # Keep DB_MAX_OVERFLOW small — bursts should queue, not blow the cap.
+    DB_POOL_SIZE: int = 0
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 60
+    # Connections opened concurrently at startup so the first burst of
+    # requests doesn't each pay the TCP+TLS+auth handshake. Capped at the
+    # resolved pool size; 0 disables pre-warming.
+    DB_POOL_PREWARM: int = 5
 
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    # PERFORMANCE: number of Uvicorn worker processes. Scale to CPU cores in
+    # production; keep at 1 for development (workers are incompatible with
+    # --reload).
+    API_WORKERS: int = 1
 
     # JWT Settings - OWASP Compliant
     JWT_ALGORITHM: str = "HS256"
@@ -24,8 +48,18 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
     # Password Security - OWASP Compliant
-    # SECURITY: Bcrypt rounds (work factor) - minimum 12 recommended by OWASP
+    # SECURITY: Bcrypt rounds (work factor) - minimum 12 recommended by OWASP.
+    # PERFORMANCE: test/CI environments may export BCRYPT_ROUNDS=4 so suites
+    # that register users don't pay ~250ms of hashing per account; login
+    # transparently re-hashes at the configured cost (see needs_rehash), so
+    # no data migration is needed when the setting changes.
     BCRYPT_ROUNDS: int = 12
+    # SECURITY: optional pepper mixed into passwords via HMAC-SHA256 before
+    # bcrypt. Kept out of the database (env/secret manager only), so leaked
+    # hashes can't be cracked offline without it. Empty string disables
+    # peppering; do NOT change or clear it once users exist, since stored
+    # hashes were minted with it.
+    PASSWORD_PEPPER: str = ""
 
     # Rate Limiting - OWASP Compliant
     # SECURITY: Maximum login attempts before rate limiting kicks in
@@ -35,10 +69,26 @@ class Settings(BaseSettings):
     # SECURITY: Account lockout duration in minutes after max attempts
     ACCOUNT_LOCKOUT_MINUTES: int = 30
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"  # Ignore extra environment variables
+    # pydantic v2 settings config; the dict form skips the legacy class-based
+    # Config shim and its deprecation path when the model is built.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",  # Ignore extra environment variables
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the cached Settings instance.
+
+    Settings() re-reads and re-validates the environment (and .env file) on
+    every construction; caching guarantees that work happens exactly once per
+    process no matter how many modules ask for configuration.
+    """
+    return Settings()
 
 
-settings = Settings()
+# Shared instance for module-level imports (`from ..core.config import settings`)
+settings = get_settings()
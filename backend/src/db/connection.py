@@ -1,8 +1,15 @@
+from fastapi import Depends
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import NullPool
-from sqlalchemy import text
+from sqlalchemy import event, text
+from contextlib import asynccontextmanager
+from typing import Annotated
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from ..core.config import settings
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +23,48 @@ connect_args = {
     "connect_timeout": 10,  # Connection timeout in seconds
 }
 
+# Neon's PgBouncer allows 64 server connections per role, shared across all
+# uvicorn workers. With DB_POOL_SIZE=0 (auto) we budget
+# floor(64 / workers) - 2 per worker, leaving headroom for overflow and
+# out-of-band connections (migrations, scripts).
+_NEON_CONN_CAP = 64
+
+
+def _resolve_pool_size() -> int:
+    """Resolve the per-worker pool size from settings or the Neon cap."""
+    if settings.DB_POOL_SIZE > 0:
+        return settings.DB_POOL_SIZE
+    return max(1, _NEON_CONN_CAP // max(1, settings.API_WORKERS) - 2)
+
+
+_pool_size = _resolve_pool_size()
+logger.info(
+    "Database pool config: pool_size=%s max_overflow=%s pool_timeout=%s "
+    "pool_recycle=%s (workers=%s, Neon cap=%s)",
+    _pool_size, settings.DB_MAX_OVERFLOW, settings.DB_POOL_TIMEOUT,
+    settings.DB_POOL_RECYCLE, settings.API_WORKERS, _NEON_CONN_CAP,
+)
+
 # Create database engine with Neon-optimized pooling
 # Using Neon's connection pooler endpoint (-pooler) with PgBouncer
+# This sync engine backs management scripts (init_db, db.utils, tests);
+# request handling goes through the async engine below.
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,  # Set to False in production
 
     # Connection Pool Settings for Serverless
-    pool_size=5,  # Minimum connections to maintain
-    max_overflow=10,  # Additional connections when pool is exhausted
-    pool_timeout=30,  # Seconds to wait for connection from pool
-    pool_recycle=3600,  # Recycle connections after 1 hour (Neon best practice)
-    pool_pre_ping=True,  # Verify connection health before using (critical for serverless)
+    pool_size=_pool_size,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Recycle sockets before PgBouncer's server_idle_timeout can kill them;
+    # proactive recycling replaces the per-checkout health check below.
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Liveness checks are handled by the throttled engine_connect listener
+    # below (DB_POOL_PRE_PING opt-in), never by pool_pre_ping: pre-ping's
+    # SELECT 1 before every checkout opens a transaction that PgBouncer
+    # (transaction mode) holds, accumulating idle-in-transaction backends.
+    pool_pre_ping=False,
 
     # Connection arguments
     connect_args=connect_args,
@@ -38,30 +75,137 @@ engine = create_engine(
 )
 
 
-def get_session():
+def _async_database_url() -> str:
+    """
+    Build the asyncpg URL from the configured DATABASE_URL.
+
+    Swaps the driver to asyncpg and strips libpq-only query options
+    (sslmode, channel_binding) that asyncpg rejects; SSL is passed via
+    connect_args instead.
+    """
+    scheme, netloc, path, query, fragment = urlsplit(settings.DATABASE_URL)
+    scheme = "postgresql+asyncpg"
+    params = [
+        (k, v) for k, v in parse_qsl(query)
+        if k not in ("sslmode", "channel_binding")
+    ]
+    return urlunsplit((scheme, netloc, path, urlencode(params), fragment))
+
+
+# Async engine for request handling. asyncpg speaks the binary protocol and
+# never blocks the event loop, unlike the sync psycopg2 engine above.
+async_engine = create_async_engine(
+    _async_database_url(),
+    echo=settings.DATABASE_ECHO,
+    pool_size=_pool_size,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before PgBouncer's server_idle_timeout (see sync engine)
+    pool_pre_ping=False,  # See the throttled engine_connect listener below
+    connect_args={
+        "ssl": "require",  # Enforce SSL for Neon (asyncpg spelling of sslmode)
+        "timeout": 10,  # Connection timeout in seconds
+    },
+)
+
+# Throttled liveness check for direct (non-pooler) Neon endpoints, enabled
+# via DB_POOL_PRE_PING. Unlike pool_pre_ping, which issues SELECT 1 before
+# *every* checkout, this pings at most once per connection per 30 seconds —
+# millions fewer round-trips over a day at any realistic request rate.
+_PING_INTERVAL_SECONDS = 30
+
+
+def _throttled_ping(connection):
+    """engine_connect listener: ping if this connection hasn't been checked recently."""
+    now = time.monotonic()
+    if connection.info.get("ping_at", 0.0) < now - _PING_INTERVAL_SECONDS:
+        connection.scalar(text("SELECT 1"))
+        connection.info["ping_at"] = now
+
+
+if settings.DB_POOL_PRE_PING:
+    event.listen(engine, "engine_connect", _throttled_ping)
+    event.listen(async_engine.sync_engine, "engine_connect", _throttled_ping)
+
+
+@asynccontextmanager
+async def session_scope():
+    """
+    Async context manager yielding a session from the async engine.
+
+    Use this when a handler wants to defer opening a session until after
+    cheap pre-checks (auth, validation) have passed, instead of having
+    Depends(get_session) check out a connection for requests that will be
+    rejected anyway.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_session():
     """
-    Dependency function to get a database session.
+    Dependency function to get an async database session.
     Use this in FastAPI endpoints with Depends(get_session).
 
-    Implements proper connection management for Neon Serverless:
-    - Automatic connection cleanup via context manager
-    - Connection reuse from pool
-    - Graceful error handling
+    The context manager alone is enough for cleanup: closing a session
+    rolls back any uncommitted state and returns the connection to the
+    pool, so no explicit rollback/close handling is needed here.
+
+    expire_on_commit=False keeps attributes loaded after commit: INSERTs
+    already populate server-generated ids via RETURNING at flush time, so
+    there is no reason to expire the object and pay a reload SELECT when
+    the handler serializes it.
 
     Example:
         @app.get("/users")
-        def get_users(session: Session = Depends(get_session)):
-            return session.exec(select(User)).all()
+        async def get_users(session: AsyncSession = Depends(get_session)):
+            return (await session.exec(select(User))).all()
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_readonly_session():
+    """
+    Dependency yielding a session whose transaction is READ ONLY.
+
+    Use for pure-read endpoints (task listing, statistics): PgBouncer in
+    transaction mode can multiplex read-only transactions across fewer
+    backends, and Postgres skips write-path bookkeeping for them.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        await session.exec(text("SET TRANSACTION READ ONLY"))
+        yield session
+
+
+# Annotated dependency aliases. FastAPI caches dependency analysis by the
+# Annotated object's identity, and routers share one declaration instead of
+# repeating `AsyncSession = Depends(get_session)` per endpoint.
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlySessionDep = Annotated[AsyncSession, Depends(get_readonly_session)]
+
+
+async def prewarm_async_pool() -> None:
     """
-    with Session(engine) as session:
-        try:
-            yield session
-        except Exception as e:
-            logger.error(f"Database session error: {e}")
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    Open and release DB_POOL_PREWARM connections concurrently at startup.
+
+    Each checkout pays the full TCP+TLS+auth handshake once; released
+    connections return to the pool warm, so the first burst of requests
+    skips connection setup entirely. Capped at the pool size so
+    pre-warming can never trigger overflow connections.
+    """
+    count = min(settings.DB_POOL_PREWARM, _pool_size)
+    if count <= 0:
+        return
+
+    import asyncio
+
+    connections = await asyncio.gather(
+        *(async_engine.connect() for _ in range(count))
+    )
+    for connection in connections:
+        await connection.close()
+    logger.info("Pre-warmed %s pooled connections", count)
 
 
 def check_connection():
@@ -78,7 +222,7 @@ def check_connection():
             logger.info("Database connection successful")
             return True
     except Exception as e:
-        logger.error(f"Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return False
 
 
@@ -91,4 +235,16 @@ def close_connections():
         engine.dispose()
         logger.info("Database connections closed")
     except Exception as e:
-        logger.error(f"Error closing database connections: {e}")
+        logger.error("Error closing database connections: %s", e)
+
+
+async def close_async_connections():
+    """
+    Gracefully close the async engine's connections.
+    Call this during application shutdown.
+    """
+    try:
+        await async_engine.dispose()
+        logger.info("Async database connections closed")
+    except Exception as e:
+        logger.error("Error closing async database connections: %s", e)
@@ -3,21 +3,30 @@ from .connection import engine, check_connection
 from ..models.user import User
 from ..models.task import Task
 import logging
-from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 logger = logging.getLogger(__name__)
 
 
-def init_db():
+def init_db(checkfirst: bool = True):
     """
     Initialize database by creating all tables.
 
     This function imports all models and creates their corresponding
     tables in the database if they don't already exist.
 
-    For production environments, use Alembic migrations instead of
-    SQLModel.metadata.create_all() for better version control and
-    rollback capabilities.
+    All CREATE TABLE / CREATE INDEX statements are compiled into a single
+    script and executed in one round-trip. metadata.sorted_tables is already
+    topologically ordered by foreign key, so dependencies are created first.
+    With checkfirst=True (the default) IF NOT EXISTS guards make the script
+    idempotent without per-table pg_catalog probes; pass checkfirst=False
+    when the schema is known to be empty (see reset_db).
+
+    For production environments, use Alembic migrations instead for better
+    version control and rollback capabilities.
+
+    Args:
+        checkfirst: Emit IF NOT EXISTS guards on every statement
 
     Raises:
         Exception: If database connection fails or table creation fails
@@ -29,11 +38,26 @@ def init_db():
             raise Exception("Failed to connect to database")
 
         # Import all models here to ensure they are registered with SQLModel
-        # This is necessary for SQLModel.metadata.create_all() to work
+        # This is necessary for SQLModel.metadata to know about the tables
         logger.info("Creating database tables...")
 
-        # Create all tables
-        SQLModel.metadata.create_all(engine)
+        # Compile one batched DDL script (tables in FK order, then indexes)
+        # and run it in a single round-trip instead of letting create_all
+        # probe pg_catalog and emit each statement separately.
+        statements = []
+        for table in SQLModel.metadata.sorted_tables:
+            statements.append(
+                CreateTable(table, if_not_exists=checkfirst).compile(engine)
+            )
+            statements.extend(
+                CreateIndex(index, if_not_exists=checkfirst).compile(engine)
+                for index in table.indexes
+            )
+        script = ";\n".join(str(stmt).strip() for stmt in statements)
+
+        with engine.connect() as conn:
+            conn.exec_driver_sql(script)
+            conn.commit()
 
         logger.info("Database tables created successfully")
         logger.info("Tables created: user, task")
@@ -60,29 +84,20 @@ def drop_all_tables():
     """
     try:
         logger.warning("Dropping all database tables...")
-        
-        # Get a connection to execute raw SQL
+
+        # Batch every DROP into one semicolon-joined script so the whole
+        # teardown costs a single round-trip to Neon instead of one per
+        # statement. DROP ... CASCADE already removes dependent foreign keys,
+        # so no separate constraint-dropping pass is needed.
+        script = ";\n".join(
+            f'DROP TABLE IF EXISTS "{table.name}" CASCADE'
+            for table in reversed(SQLModel.metadata.sorted_tables)
+        )
+
         with engine.connect() as conn:
-            # First, drop all foreign key constraints to avoid dependency issues
-            # This query gets all foreign key constraints in the database
-            inspector = inspect(engine)
-            for table_name in reversed(inspector.get_table_names()):
-                # Get foreign key constraints for this table
-                fks = inspector.get_foreign_keys(table_name)
-                for fk in fks:
-                    # Drop the foreign key constraint first
-                    conn.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {fk['name']} CASCADE"))
-            
-            # Commit the transaction
+            conn.exec_driver_sql(script)
             conn.commit()
-            
-            # Now drop all tables with CASCADE
-            for table in reversed(SQLModel.metadata.sorted_tables):
-                conn.execute(text(f'DROP TABLE IF EXISTS "{table.name}" CASCADE'))
-            
-            # Commit the transaction
-            conn.commit()
-        
+
         logger.info("All tables dropped successfully")
     except Exception as e:
         logger.error(f"Failed to drop tables: {e}")
@@ -101,8 +116,23 @@ def reset_db():
     try:
         logger.warning("Resetting database...")
         drop_all_tables()
-        init_db()
+        # Everything was just dropped, so skip the IF NOT EXISTS guards /
+        # existence checks entirely.
+        init_db(checkfirst=False)
         logger.info("Database reset complete")
     except Exception as e:
         logger.error(f"Database reset failed: {e}")
         raise
+
+
+if __name__ == "__main__":
+    # One-shot management command, run once per deployment:
+    #   python -m src.db.init_db          create missing tables
+    #   python -m src.db.init_db --reset  drop and recreate all tables (dev only)
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    if "--reset" in sys.argv[1:]:
+        reset_db()
+    else:
+        init_db()
@@ -6,6 +6,9 @@ optimized for Neon Serverless PostgreSQL.
 """
 
 from sqlmodel import Session, select
+from sqlalchemy import and_, func, lambda_stmt, text, update
+from sqlalchemy.orm.attributes import set_committed_value
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
@@ -17,6 +20,34 @@ from ..models.task import Task
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def bulk_load(session: Session):
+    """
+    Run a block of writes with synchronous_commit off, then commit.
+
+    Each commit normally waits for a WAL fsync; turning
+    synchronous_commit off for the duration lets bulk ingest (test
+    seeding, migrations, backfills) skip that wait on every row or
+    batch. Safe only where a crash losing the trailing tail of writes is
+    acceptable — never wrap user-facing request handling in this.
+
+    Uses a session-level SET with a RESET in finally (rather than SET
+    LOCAL) because helpers like create_task commit per call, and SET
+    LOCAL dies with the first transaction. That makes this reliable on a
+    direct Postgres endpoint (scripts, migrations); through PgBouncer in
+    transaction mode the GUC may not follow the server connection, so it
+    degrades to normal durability rather than misbehaving.
+    """
+    session.exec(text("SET synchronous_commit = off"))
+    try:
+        yield session
+        session.commit()
+    finally:
+        session.rollback()
+        session.exec(text("RESET synchronous_commit"))
+        session.commit()
+
+
 # User Operations
 def get_user_by_email(session: Session, email: str) -> Optional[User]:
     """
@@ -67,13 +98,15 @@ def create_user(session: Session, email: str, password_hash: str) -> User:
     try:
         user = User(email=email, password_hash=password_hash)
         session.add(user)
+        # Flush populates the id via INSERT ... RETURNING; no post-commit
+        # refresh round-trip is needed.
+        session.flush()
+        logger.info("User created: %s", user.id)
         session.commit()
-        session.refresh(user)
-        logger.info(f"User created: {user.id}")
         return user
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to create user: {e}")
+        logger.error("Failed to create user: %s", e)
         raise
 
 
@@ -100,20 +133,24 @@ def get_user_tasks(
     Returns:
         List of Task objects
     """
-    statement = select(Task).where(Task.user_id == user_id)
+    # lambda_stmt caches the compiled SQL keyed on statement structure, so
+    # repeat calls skip Core compilation and only rebind parameters. This is
+    # client-side caching only — PgBouncer in transaction mode does not
+    # allow server-side prepared statements.
+    statement = lambda_stmt(lambda: select(Task))
+    statement += lambda s: s.where(Task.user_id == user_id)
 
     if is_complete is not None:
-        statement = statement.where(Task.is_complete == is_complete)
+        statement += lambda s: s.where(Task.is_complete == is_complete)
 
     # Order by due_date (nulls last), then by created_at
-    statement = statement.order_by(
+    statement += lambda s: s.order_by(
         Task.due_date.asc().nullslast(),
         Task.created_at.desc()
     )
+    statement += lambda s: s.offset(offset).limit(limit)
 
-    statement = statement.offset(offset).limit(limit)
-
-    return session.exec(statement).all()
+    return session.scalars(statement).all()
 
 
 def get_task_by_id(session: Session, task_id: int, user_id: int) -> Optional[Task]:
@@ -128,11 +165,13 @@ def get_task_by_id(session: Session, task_id: int, user_id: int) -> Optional[Tas
     Returns:
         Task object if found and belongs to user, None otherwise
     """
-    statement = select(Task).where(
-        Task.id == task_id,
-        Task.user_id == user_id
-    )
-    return session.exec(statement).first()
+    # session.get short-circuits through the identity map and uses the
+    # cached PK lookup, skipping Core statement compilation; ownership is
+    # checked in Python on the fetched row.
+    task = session.get(Task, task_id)
+    if task is None or task.user_id != user_id:
+        return None
+    return task
 
 
 def create_task(
@@ -166,13 +205,15 @@ def create_task(
             due_date=due_date
         )
         session.add(task)
+        # Flush populates the id via INSERT ... RETURNING; no post-commit
+        # refresh round-trip is needed.
+        session.flush()
+        logger.info("Task created: %s for user %s", task.id, user_id)
         session.commit()
-        session.refresh(task)
-        logger.info(f"Task created: {task.id} for user {user_id}")
         return task
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to create task: {e}")
+        logger.error("Failed to create task: %s", e)
         raise
 
 
@@ -205,11 +246,11 @@ def update_task(
         session.add(task)
         session.commit()
         session.refresh(task)
-        logger.info(f"Task updated: {task.id}")
+        logger.info("Task updated: %s", task.id)
         return task
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to update task: {e}")
+        logger.error("Failed to update task: %s", e)
         raise
 
 
@@ -227,10 +268,10 @@ def delete_task(session: Session, task: Task) -> None:
     try:
         session.delete(task)
         session.commit()
-        logger.info(f"Task deleted: {task.id}")
+        logger.info("Task deleted: %s", task.id)
     except Exception as e:
         session.rollback()
-        logger.error(f"Failed to delete task: {e}")
+        logger.error("Failed to delete task: %s", e)
         raise
 
 
@@ -238,15 +279,46 @@ def toggle_task_completion(session: Session, task: Task) -> Task:
     """
     Toggle task completion status.
 
+    The flip happens server-side in a single UPDATE ... RETURNING round-trip
+    (the ~Task.is_complete predicate negates in SQL), instead of the previous
+    load/UPDATE/refresh sequence.
+
     Args:
         session: Database session
         task: Task object to toggle
 
     Returns:
         Updated Task object
+
+    Raises:
+        Exception: If the task no longer exists
     """
-    task.is_complete = not task.is_complete
-    return update_task(session, task)
+    try:
+        statement = (
+            update(Task)
+            .where(Task.id == task.id, Task.user_id == task.user_id)
+            # No explicit updated_at: the column's onupdate expression
+            # (timezone('utc', now())) is embedded in every Core UPDATE;
+            # a bare now() here would write server-local time into the
+            # naive TIMESTAMP column.
+            .values(is_complete=~Task.is_complete)
+            .returning(Task.is_complete, Task.updated_at)
+        )
+        row = session.execute(statement).one()
+        session.commit()
+
+        # Reflect the server-side result on the in-memory object without
+        # marking it dirty (a plain assignment would queue a redundant
+        # UPDATE on the next flush).
+        set_committed_value(task, "is_complete", row.is_complete)
+        set_committed_value(task, "updated_at", row.updated_at)
+
+        logger.info("Task completion toggled: %s -> %s", task.id, task.is_complete)
+        return task
+    except Exception as e:
+        session.rollback()
+        logger.error("Failed to toggle task completion: %s", e)
+        raise
 
 
 def get_task_statistics(session: Session, user_id: int) -> Dict[str, Any]:
@@ -260,22 +332,24 @@ def get_task_statistics(session: Session, user_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with task statistics
     """
-    all_tasks = session.exec(
-        select(Task).where(Task.user_id == user_id)
-    ).all()
-
-    completed = sum(1 for task in all_tasks if task.is_complete)
-    pending = len(all_tasks) - completed
-
-    overdue = sum(
-        1 for task in all_tasks
-        if not task.is_complete and task.due_date and task.due_date < datetime.now().date()
-    )
+    # Single aggregate round-trip: COUNT(*) FILTER (...) computes all three
+    # counters in Postgres against the (user_id, is_complete, due_date)
+    # composite index, instead of shipping every task row over the wire and
+    # counting in Python.
+    statement = select(
+        func.count().label("total"),
+        func.count().filter(Task.is_complete == True).label("completed"),
+        func.count().filter(
+            and_(Task.is_complete == False, Task.due_date < func.current_date())
+        ).label("overdue"),
+    ).where(Task.user_id == user_id)
+
+    total, completed, overdue = session.exec(statement).one()
 
     return {
-        "total": len(all_tasks),
+        "total": total,
         "completed": completed,
-        "pending": pending,
+        "pending": total - completed,
         "overdue": overdue,
-        "completion_rate": (completed / len(all_tasks) * 100) if all_tasks else 0
+        "completion_rate": (completed / total * 100) if total else 0
     }
@@ -6,7 +6,7 @@ new tasks in the database for authenticated users.
 """
 
 import logging
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...services.task_service import create_task
 from ...models.mcp_models import AddTaskRequest, AddTaskResponse
 from ...models.task import TaskCreate
@@ -15,7 +15,7 @@ from ...models.task import TaskCreate
 logger = logging.getLogger(__name__)
 
 
-async def add_task_handler(request: AddTaskRequest, session: Session) -> AddTaskResponse:
+async def add_task_handler(request: AddTaskRequest, session: AsyncSession) -> AddTaskResponse:
     """
     Handle the add_task MCP tool request.
     
@@ -37,14 +37,16 @@ async def add_task_handler(request: AddTaskRequest, session: Session) -> AddTask
         # Use the existing service to create the task
         task = await create_task(session, task_create_data, request.user_id)
         
-        # Return success response with the new task ID
-        return AddTaskResponse(
+        # Return success response with the new task ID.
+        # model_construct skips the validator entry: every field here is a
+        # trusted server-side value, so revalidating it buys nothing.
+        return AddTaskResponse.model_construct(
             success=True,
             task_id=task.id
         )
     except Exception as e:
-        logger.error(f"Error in add_task_handler: {str(e)}")
-        return AddTaskResponse(
+        logger.error("Error in add_task_handler: %s", str(e))
+        return AddTaskResponse.model_construct(
             success=False,
             error_message=str(e)
         )
\ No newline at end of file
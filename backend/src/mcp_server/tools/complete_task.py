@@ -6,7 +6,7 @@ the completion status of tasks for authenticated users.
 """
 
 import logging
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...services.task_service import toggle_complete
 from ...models.mcp_models import CompleteTaskRequest, CompleteTaskResponse
 
@@ -14,7 +14,7 @@ from ...models.mcp_models import CompleteTaskRequest, CompleteTaskResponse
 logger = logging.getLogger(__name__)
 
 
-async def complete_task_handler(request: CompleteTaskRequest, session: Session) -> CompleteTaskResponse:
+async def complete_task_handler(request: CompleteTaskRequest, session: AsyncSession) -> CompleteTaskResponse:
     """
     Handle the complete_task MCP tool request.
     
@@ -29,14 +29,16 @@ async def complete_task_handler(request: CompleteTaskRequest, session: Session)
         # Use the existing service to toggle the task completion status
         task = await toggle_complete(session, request.task_id, request.user_id)
         
-        # Return success response with the task ID
-        return CompleteTaskResponse(
+        # Return success response with the task ID.
+        # model_construct skips the validator entry: every field here is a
+        # trusted server-side value, so revalidating it buys nothing.
+        return CompleteTaskResponse.model_construct(
             success=True,
             task_id=task.id
         )
     except Exception as e:
-        logger.error(f"Error in complete_task_handler: {str(e)}")
-        return CompleteTaskResponse(
+        logger.error("Error in complete_task_handler: %s", str(e))
+        return CompleteTaskResponse.model_construct(
             success=False,
             error_message=str(e)
         )
\ No newline at end of file
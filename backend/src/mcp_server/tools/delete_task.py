@@ -6,7 +6,7 @@ tasks for authenticated users.
 """
 
 import logging
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...services.task_service import delete_task
 from ...models.mcp_models import DeleteTaskRequest, DeleteTaskResponse
 
@@ -14,7 +14,7 @@ from ...models.mcp_models import DeleteTaskRequest, DeleteTaskResponse
 logger = logging.getLogger(__name__)
 
 
-async def delete_task_handler(request: DeleteTaskRequest, session: Session) -> DeleteTaskResponse:
+async def delete_task_handler(request: DeleteTaskRequest, session: AsyncSession) -> DeleteTaskResponse:
     """
     Handle the delete_task MCP tool request.
     
@@ -29,13 +29,15 @@ async def delete_task_handler(request: DeleteTaskRequest, session: Session) -> D
         # Use the existing service to delete the task
         await delete_task(session, request.task_id, request.user_id)
         
-        # Return success response
-        return DeleteTaskResponse(
+        # Return success response.
+        # model_construct skips the validator entry: every field here is a
+        # trusted server-side value, so revalidating it buys nothing.
+        return DeleteTaskResponse.model_construct(
             success=True
         )
     except Exception as e:
-        logger.error(f"Error in delete_task_handler: {str(e)}")
-        return DeleteTaskResponse(
+        logger.error("Error in delete_task_handler: %s", str(e))
+        return DeleteTaskResponse.model_construct(
             success=False,
             error_message=str(e)
         )
\ No newline at end of file
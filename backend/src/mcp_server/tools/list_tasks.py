@@ -6,7 +6,7 @@ tasks for authenticated users.
 """
 
 import logging
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...services.task_service import get_tasks
 from ...models.mcp_models import ListTasksRequest, ListTasksResponse
 
@@ -14,7 +14,7 @@ from ...models.mcp_models import ListTasksRequest, ListTasksResponse
 logger = logging.getLogger(__name__)
 
 
-async def list_tasks_handler(request: ListTasksRequest, session: Session) -> ListTasksResponse:
+async def list_tasks_handler(request: ListTasksRequest, session: AsyncSession) -> ListTasksResponse:
     """
     Handle the list_tasks MCP tool request.
     
@@ -34,30 +34,19 @@ async def list_tasks_handler(request: ListTasksRequest, session: Session) -> Lis
             limit=request.limit,
             offset=request.offset
         )
-        
-        # Convert tasks to dictionaries for the response
-        task_dicts = []
-        for task in tasks:
-            task_dict = {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "is_complete": task.is_complete,
-                "user_id": task.user_id,
-                "created_at": task.created_at.isoformat(),
-                "updated_at": task.updated_at.isoformat()
-            }
-            task_dicts.append(task_dict)
-        
-        # Return success response with the tasks
+
+        # The validating constructor here, not model_construct: the service
+        # returns Core Row objects that must be coerced into TaskResponse
+        # via from_attributes, and FastAPI's response_model pass does not
+        # revalidate an already-constructed model — unconverted rows would
+        # fail at serialization time.
         return ListTasksResponse(
             success=True,
-            tasks=task_dicts
+            tasks=tasks
         )
     except Exception as e:
-        logger.error(f"Error in list_tasks_handler: {str(e)}")
-        return ListTasksResponse(
+        logger.error("Error in list_tasks_handler: %s", str(e))
+        return ListTasksResponse.model_construct(
             success=False,
             tasks=[],
             error_message=str(e)
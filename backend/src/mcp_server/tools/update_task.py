@@ -6,7 +6,7 @@ task properties for authenticated users.
 """
 
 import logging
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ...services.task_service import update_task
 from ...models.mcp_models import UpdateTaskRequest, UpdateTaskResponse
 from ...models.task import TaskUpdate
@@ -15,7 +15,7 @@ from ...models.task import TaskUpdate
 logger = logging.getLogger(__name__)
 
 
-async def update_task_handler(request: UpdateTaskRequest, session: Session) -> UpdateTaskResponse:
+async def update_task_handler(request: UpdateTaskRequest, session: AsyncSession) -> UpdateTaskResponse:
     """
     Handle the update_task MCP tool request.
     
@@ -27,30 +27,35 @@ async def update_task_handler(request: UpdateTaskRequest, session: Session) -> U
         UpdateTaskResponse with success status and task_id or error message
     """
     try:
-        # Create a TaskUpdate object from the request, only including provided fields
-        update_data = {}
-        if request.title is not None:
-            update_data['title'] = request.title
-        if request.description is not None:
-            update_data['description'] = request.description
-        if request.due_date is not None:
-            update_data['due_date'] = request.due_date.date()  # Convert datetime to date
-        if request.completed is not None:
-            update_data['is_complete'] = request.completed
-            
-        task_update_data = TaskUpdate(**update_data)
+        # Create a TaskUpdate object from the request, only including provided
+        # fields. The values were already validated on the way into
+        # UpdateTaskRequest, so model_construct skips a second identical
+        # validator run; the conditional build keeps __pydantic_fields_set__
+        # to just the provided keys, which the service's
+        # model_dump(exclude_unset=True) partial update depends on.
+        fields = {
+            'title': request.title,
+            'description': request.description,
+            'due_date': request.due_date.date() if request.due_date else None,
+            'is_complete': request.completed,
+        }
+        task_update_data = TaskUpdate.model_construct(
+            **{k: v for k, v in fields.items() if v is not None}
+        )
         
         # Use the existing service to update the task
         task = await update_task(session, request.task_id, task_update_data, request.user_id)
         
-        # Return success response with the task ID
-        return UpdateTaskResponse(
+        # Return success response with the task ID.
+        # model_construct skips the validator entry: every field here is a
+        # trusted server-side value, so revalidating it buys nothing.
+        return UpdateTaskResponse.model_construct(
             success=True,
             task_id=task.id
         )
     except Exception as e:
-        logger.error(f"Error in update_task_handler: {str(e)}")
-        return UpdateTaskResponse(
+        logger.error("Error in update_task_handler: %s", str(e))
+        return UpdateTaskResponse.model_construct(
             success=False,
             error_message=str(e)
         )
\ No newline at end of file
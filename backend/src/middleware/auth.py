@@ -1,7 +1,11 @@
 from fastapi import Depends
+from typing import Annotated
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import hashlib
+import jwt
+from jwt import InvalidTokenError as JWTError
 import logging
+import time
 from ..core.config import settings
 from ..core.exceptions import UnauthorizedError
 
@@ -9,6 +13,77 @@ from ..core.exceptions import UnauthorizedError
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
+# Hot-path settings, bound once at import (see auth_service for rationale):
+# read on every authenticated request.
+_SECRET = settings.BETTER_AUTH_SECRET
+_ALGORITHMS = [settings.JWT_ALGORITHM]
+# Require the claims we rely on during decode itself, so missing-claim
+# checks don't need separate Python-level passes over the payload.
+_DECODE_OPTIONS = {"require": ["exp", "iat", "sub"]}
+
+# Verified-token cache keyed by a 16-byte blake2b digest of the token rather
+# than the token string itself: entries cost ~40 bytes instead of holding the
+# full ~200-byte bearer string, so the cap costs ~160KB. A digest collision
+# would require breaking blake2b, so a hit carries the same trust as the
+# original HMAC verification.
+_TOKEN_CACHE_MAX = 4096
+_token_cache: dict[bytes, tuple[int, int]] = {}
+
+
+def _decode_access_token(token: str) -> tuple[int, int]:
+    """
+    Decode and validate an access token, caching the result per token.
+
+    Tokens are immutable, so signature verification and claim checks only
+    need to happen once per token per process; repeat requests with the same
+    bearer token hit the cache. Expiration is NOT trusted from the cache —
+    callers must re-check the returned exp on every request.
+
+    No explicit invalidation hook is needed: there is no logout or token
+    revocation endpoint, so a cached entry stays valid exactly as long as
+    the token itself. When the cache fills, expired entries are swept
+    first; only if every entry is still live does it reset wholesale.
+
+    Returns:
+        (user_id, exp) tuple where exp is a unix timestamp
+
+    Raises:
+        UnauthorizedError: If token is invalid, wrong type, or malformed
+        JWTError: If signature/expiration validation fails
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # SECURITY: Decode and verify the JWT token signature, expiration, and
+    # required claims in one pass (require makes the decode itself reject
+    # tokens missing exp/iat/sub, so no separate None checks are needed).
+    payload = jwt.decode(
+        token, _SECRET, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS
+    )
+
+    # SECURITY: Verify token type to prevent refresh token misuse
+    token_type = payload.get("type")
+    if token_type != "access":
+        logger.warning(
+            f"Invalid token type '{token_type}' used for authentication. "
+            "Expected 'access' token."
+        )
+        raise UnauthorizedError("Invalid authentication credentials")
+
+    result = (int(payload["sub"]), int(payload["exp"]))
+
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        now = time.time()
+        expired = [k for k, (_, exp) in _token_cache.items() if exp <= now]
+        for k in expired:
+            del _token_cache[k]
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+    _token_cache[key] = result
+    return result
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -18,13 +93,15 @@ async def get_current_user(
 
     Security Features:
     - Validates token signature using secret key
-    - Verifies token expiration
+    - Verifies token expiration on every request (even on cache hits)
     - Ensures token type is 'access' (not refresh)
-    - Uses constant-time comparison for token validation
     - Returns generic error messages to prevent information leakage
 
-    This dependency extracts the user ID from a valid JWT access token.
-    Use this in route handlers to get the authenticated user's ID.
+    Performance:
+    - Signature verification results are cached per token (keyed by a
+      blake2b digest), so repeat requests with the same bearer token skip
+      the HMAC work. Expiration is re-checked on every call, so a cached
+      token can never outlive its exp claim.
 
     Args:
         credentials: HTTP Bearer token from Authorization header
@@ -49,36 +126,22 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        # SECURITY: Decode and verify the JWT token signature and expiration
-        payload = jwt.decode(
-            token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-
-        # SECURITY: Verify token type to prevent refresh token misuse
-        token_type = payload.get("type")
-        if token_type != "access":
-            logger.warning(
-                f"Invalid token type '{token_type}' used for authentication. "
-                "Expected 'access' token."
-            )
-            raise UnauthorizedError("Invalid authentication credentials")
-
-        # Extract user ID from token
-        user_id: str = payload.get("sub")
-
-        if user_id is None:
-            # SECURITY: Don't expose internal details in error messages
-            logger.warning("Token missing 'sub' claim")
-            raise UnauthorizedError("Invalid authentication credentials")
-
-        logger.debug(f"User {user_id} authenticated successfully")
-        return int(user_id)
-
+        user_id, exp = _decode_access_token(token)
     except JWTError as e:
         # SECURITY: Log the actual error but return generic message to client
         # This prevents attackers from learning about token structure or validation logic
-        logger.warning(f"JWT validation failed: {str(e)}")
+        logger.warning("JWT validation failed: %s", str(e))
+        raise UnauthorizedError("Invalid authentication credentials")
+
+    # SECURITY: expiration must be enforced outside the cache
+    if time.time() >= exp:
+        logger.warning("Expired access token presented for user %s", user_id)
         raise UnauthorizedError("Invalid authentication credentials")
 
+    logger.debug("User %s authenticated successfully", user_id)
+    return user_id
+
+
+# Annotated alias so routers can declare `current_user_id: UserDep` and share
+# one cached dependency declaration (see SessionDep in db/connection.py).
+UserDep = Annotated[int, Depends(get_current_user)]
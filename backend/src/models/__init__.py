@@ -1 +1,13 @@
-"""Database models package."""
+"""Database models package.
+
+Importing the modules here registers every mapped class with the shared
+SQLModel registry, so string references in relationships (e.g.
+Conversation.user -> "User") resolve no matter which model a consumer
+imports first.
+"""
+
+from .user import User
+from .task import Task
+from .conversation import Conversation, Message
+
+__all__ = ["User", "Task", "Conversation", "Message"]
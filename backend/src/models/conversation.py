@@ -1,13 +1,18 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from pydantic import field_validator
-import re
 
 if TYPE_CHECKING:
     from .user import User
 
 
+# Allowed message roles: frozenset gives O(1) membership with no per-call
+# list allocation in the validator.
+_ALLOWED_ROLES = frozenset({"user", "assistant", "system"})
+
+
 class Conversation(SQLModel, table=True):
     """
     Conversation model to track AI agent interactions with users.
@@ -21,14 +26,30 @@ class Conversation(SQLModel, table=True):
     # Relationship to user
     user: "User" = Relationship(back_populates="conversations")
 
+    # Messages in this conversation. Access via selectinload (see
+    # get_conversation_with_messages) — a lazy load per conversation row
+    # is the classic N+1.
+    messages: List["Message"] = Relationship(back_populates="conversation")
+
 
 class Message(SQLModel, table=True):
     """
     Message model to store individual messages in a conversation.
+
+    Indexes:
+    - (conversation_id, timestamp): covers the per-conversation history
+      fetch, which filters on conversation_id and orders by timestamp
     """
+    __table_args__ = (
+        Index("ix_msg_conv_ts", "conversation_id", "timestamp"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     conversation_id: int = Field(foreign_key="conversation.id")
-    role: str = Field(regex=r"^(user|assistant|system)$")  # user, assistant, or system
+    # user, assistant, or system — enforced once by validate_role's frozenset
+    # lookup; a Field regex here would re-check the same invariant with a
+    # regex engine invocation per message on top of it.
+    role: str = Field()
     content: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
@@ -39,6 +60,6 @@ class Message(SQLModel, table=True):
     @classmethod
     def validate_role(cls, v: str) -> str:
         """Validate that the role is one of the allowed values."""
-        if v not in ['user', 'assistant', 'system']:
+        if v not in _ALLOWED_ROLES:
             raise ValueError("Role must be one of: user, assistant, system")
         return v
\ No newline at end of file
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
+from .task import TaskResponse
+
 
 class UserRole(str, Enum):
     user = "user"
@@ -10,7 +12,24 @@ class UserRole(str, Enum):
     system = "system"
 
 
+# Shared config for tool request/response models. frozen=True lets
+# pydantic-core skip per-field setattr validation machinery (these models are
+# never mutated after construction), and validate_assignment=False avoids
+# re-walking the schema on attribute writes. extra="forbid" is deliberate over
+# extra="ignore": both skip carrying unknown keys, cost the same, and forbid
+# surfaces a misbehaving agent's payload as a 422 instead of masking it.
+_REQUEST_CONFIG = ConfigDict(
+    frozen=True,
+    validate_assignment=False,
+    str_strip_whitespace=True,
+    extra="forbid",
+)
+_RESPONSE_CONFIG = ConfigDict(frozen=True, validate_assignment=False)
+
+
 class AddTaskRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user creating the task")
     title: str = Field(..., min_length=1, max_length=200, description="The title of the task")
     description: Optional[str] = Field(None, max_length=2000, description="The description of the task")
@@ -18,12 +37,16 @@ class AddTaskRequest(BaseModel):
 
 
 class AddTaskResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     task_id: Optional[int] = None
     error_message: Optional[str] = None
 
 
 class ListTasksRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user whose tasks to retrieve")
     include_completed: Optional[bool] = Field(True, description="Whether to include completed tasks")
     limit: Optional[int] = Field(50, ge=1, le=100, description="Maximum number of tasks to return")
@@ -31,34 +54,49 @@ class ListTasksRequest(BaseModel):
 
 
 class ListTasksResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
-    tasks: List[dict]  # Will contain task data as returned by the existing TaskResponse model
+    # Typed as TaskResponse so handlers can pass ORM objects straight
+    # through; pydantic-core validates and serializes them (datetimes
+    # included) in one pass instead of a hand-rolled dict/isoformat loop.
+    tasks: List[TaskResponse]
     error_message: Optional[str] = None
 
 
 class CompleteTaskRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user requesting the change")
     task_id: int = Field(..., description="The ID of the task to update")
     completed: bool = Field(True, description="Whether the task is completed (true) or not (false)")
 
 
 class CompleteTaskResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     task_id: Optional[int] = None
     error_message: Optional[str] = None
 
 
 class DeleteTaskRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user requesting the deletion")
     task_id: int = Field(..., description="The ID of the task to delete")
 
 
 class DeleteTaskResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     error_message: Optional[str] = None
 
 
 class UpdateTaskRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user requesting the update")
     task_id: int = Field(..., description="The ID of the task to update")
     title: Optional[str] = Field(None, min_length=1, max_length=200, description="New title for the task")
@@ -68,29 +106,39 @@ class UpdateTaskRequest(BaseModel):
 
 
 class UpdateTaskResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     task_id: Optional[int] = None
     error_message: Optional[str] = None
 
 
 class ConversationRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     user_id: int = Field(..., description="The ID of the user creating the conversation")
     title: str = Field(..., max_length=200, description="The title of the conversation")
 
 
 class ConversationResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     conversation_id: Optional[int] = None
     error_message: Optional[str] = None
 
 
 class MessageRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     conversation_id: int = Field(..., description="The ID of the conversation")
     role: UserRole = Field(..., description="The role of the message sender (user, assistant, system)")
     content: str = Field(..., description="The content of the message")
 
 
 class MessageResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     message_id: Optional[int] = None
     error_message: Optional[str] = None
\ No newline at end of file
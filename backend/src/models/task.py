@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, DateTime, func, Index
+from sqlalchemy import Index, func, text
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
 
@@ -8,6 +8,12 @@ if TYPE_CHECKING:
     from .user import User
 
 
+# Server-side clock for the naive-UTC timestamp columns. Plain now() yields
+# the server's local time when cast to TIMESTAMP WITHOUT TIME ZONE; the
+# timezone() wrapper pins it to UTC regardless of the server's TimeZone GUC.
+_UTC_NOW = func.timezone('utc', func.now())
+
+
 class Task(SQLModel, table=True):
     """
     Task model for todo items.
@@ -16,6 +22,10 @@ class Task(SQLModel, table=True):
     - user_id: Foreign key index for fast user task lookups
     - idx_task_user_status_date: Composite index on (user_id, is_complete, due_date)
       for optimized filtering and sorting queries
+    - idx_task_user_created_id: Composite index on (user_id, created_at DESC,
+      id DESC) matching the keyset-paginated list ordering
+    - ix_task_user_pending_created: Partial index on (user_id, created_at DESC)
+      WHERE is_complete = false, serving the pending-tasks view
 
     Constraints:
     - title: NOT NULL
@@ -32,6 +42,19 @@ class Task(SQLModel, table=True):
         # - Filter by completion status
         # - Sort by due date
         Index('idx_task_user_status_date', 'user_id', 'is_complete', 'due_date'),
+        # Matches the list ordering (created_at DESC, id DESC) within a user,
+        # so keyset pagination's row-value seek is an index range scan.
+        Index('idx_task_user_created_id', text('user_id'), text('created_at DESC'), text('id DESC')),
+        # Partial index for the dashboard "pending" view
+        # (include_completed=False). Most tasks end up completed, so
+        # indexing only the open ones keeps this b-tree small and hot in
+        # cache while the query shape stays unchanged.
+        Index(
+            'ix_task_user_pending_created',
+            text('user_id'),
+            text('created_at DESC'),
+            postgresql_where=text('is_complete = false'),
+        ),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -75,18 +98,25 @@ class Task(SQLModel, table=True):
         description="ID of the user who owns this task"
     )
 
-    # Timestamps with automatic management
+    # Timestamps with automatic management, filled server-side: no Python
+    # clock call per write, no serialized datetime in the statement payload,
+    # and no drift between app hosts. SQLAlchemy 2.0's eager_defaults="auto"
+    # fetches the values back through the INSERT's RETURNING clause, so
+    # instances still carry them after commit without an extra SELECT.
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
+        sa_column_kwargs={"server_default": _UTC_NOW},
         nullable=False,
         description="Task creation timestamp"
     )
 
-    # Auto-updating timestamp using SQLAlchemy's onupdate
+    # Auto-updating timestamp: the onupdate SQL expression is embedded in
+    # every UPDATE, so Core writes get it without naming the column.
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default=None,
         sa_column_kwargs={
-            "onupdate": datetime.utcnow,  # Automatically update on record modification
+            "server_default": _UTC_NOW,
+            "onupdate": _UTC_NOW,  # Automatically update on record modification
             "nullable": False
         },
         description="Last modification timestamp"
@@ -1,7 +1,6 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, DateTime, func
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING, List
+from typing import List, Optional, TYPE_CHECKING
 from pydantic import field_validator
 import re
 
@@ -9,6 +8,24 @@ if TYPE_CHECKING:
     from .conversation import Conversation
     from .task import Task
 
+# Compiled once at import: re.match on a string literal rebuilds the pattern
+# string and goes through the regex cache lookup on every signup.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# SECURITY: special characters accepted toward password strength. Hoisted to
+# module scope as a frozenset for O(1) membership in the strength check.
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Bit flags accumulated by the single-pass password strength check, paired
+# with the error raised when that character class is missing.
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+_STRENGTH_ERRORS = (
+    (_HAS_UPPER, "Password must contain at least one uppercase letter"),
+    (_HAS_LOWER, "Password must contain at least one lowercase letter"),
+    (_HAS_DIGIT, "Password must contain at least one digit"),
+    (_HAS_SPECIAL, "Password must contain at least one special character (!@#$%^&*()_+-=[]{}|;:,.<>?)"),
+)
+
 
 class User(SQLModel, table=True):
     """
@@ -73,6 +90,12 @@ class User(SQLModel, table=True):
         description="Account creation timestamp"
     )
 
+    # Inverse sides of Task.user / Conversation.user. Without these the
+    # mapper fails to configure at the first ORM query, since both of
+    # those relationships declare back_populates against this model.
+    tasks: List["Task"] = Relationship(back_populates="user")
+    conversations: List["Conversation"] = Relationship(back_populates="user")
+
 
 
 class UserCreate(SQLModel):
@@ -93,8 +116,7 @@ class UserCreate(SQLModel):
     @classmethod
     def validate_email_format(cls, v: str) -> str:
         """Validate email format and normalize to lowercase."""
-        email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_regex, v):
+        if not _EMAIL_RE.match(v):
             raise ValueError("Invalid email format")
         return v.lower().strip()
 
@@ -113,16 +135,23 @@ class UserCreate(SQLModel):
         """
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        # SECURITY: Require special characters for stronger passwords
-        special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        if not any(c in special_chars for c in v):
-            raise ValueError("Password must contain at least one special character (!@#$%^&*()_+-=[]{}|;:,.<>?)")
+
+        # Single pass over the password accumulating one flag bit per
+        # character class, instead of four separate any(...) scans.
+        flags = 0
+        for c in v:
+            if c.isupper():
+                flags |= _HAS_UPPER
+            elif c.islower():
+                flags |= _HAS_LOWER
+            elif c.isdigit():
+                flags |= _HAS_DIGIT
+            elif c in _SPECIAL_CHARS:
+                flags |= _HAS_SPECIAL
+
+        for bit, error in _STRENGTH_ERRORS:
+            if not flags & bit:
+                raise ValueError(error)
         return v
 
 
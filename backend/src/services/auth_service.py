@@ -1,17 +1,64 @@
+import base64
+import hashlib
+import hmac
+from calendar import timegm
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
-from sqlmodel import Session
+import jwt
+import orjson
+from jwt import InvalidTokenError as JWTError
+from sqlalchemy import Row, case, text, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 import logging
 from typing import Optional
 from ..models.user import User, UserLogin
 from ..core.config import settings
 from ..core.exceptions import UnauthorizedError
-from .user_service import get_user_by_email, verify_password
+from .user_service import (
+    get_user_auth_fields,
+    hash_password,
+    invalidate_user_cache,
+    needs_rehash,
+    run_bcrypt,
+    verify_password,
+)
 
 logger = logging.getLogger(__name__)
 
-
-def create_access_token(user_id: int) -> str:
+# Hot-path settings, bound once at import. Every token encode/decode reads
+# these; a module global is an order of magnitude cheaper in CPython than an
+# attribute lookup on the pydantic settings model.
+_SECRET = settings.BETTER_AUTH_SECRET
+_ALGORITHM = settings.JWT_ALGORITHM
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+# Require the claims we rely on during decode itself (see middleware/auth).
+_DECODE_OPTIONS = {"require": ["exp", "iat", "sub"]}
+# Constant parts of the token payloads, merged per call so only the claims
+# that actually vary (sub/exp/iat) are computed per token.
+_ACCESS_TEMPLATE = {"type": "access"}
+_REFRESH_TEMPLATE = {"type": "refresh"}
+
+# Token issuance signs directly with hmac/hashlib when the configured
+# algorithm is HS256 (the default): one orjson dump, two base64 encodes and
+# one HMAC op per token, skipping the JWT library's per-call algorithm lookup
+# and stdlib-json serialization. Verification stays on jwt.decode, which owns
+# the constant-time signature comparison.
+_USE_FAST_HS256 = _ALGORITHM == "HS256"
+_SECRET_BYTES = _SECRET.encode()
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+def _sign_hs256(payload: dict) -> str:
+    """Serialize and sign a claims dict as an HS256 JWT."""
+    body = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signing_input = _HEADER_B64 + b"." + body
+    signature = base64.urlsafe_b64encode(
+        hmac.new(_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    ).rstrip(b"=")
+    return (signing_input + b"." + signature).decode("ascii")
+
+
+def create_access_token(user_id: int, now: Optional[datetime] = None) -> str:
     """
     Create a JWT access token for the user.
 
@@ -22,32 +69,34 @@ def create_access_token(user_id: int) -> str:
 
     Args:
         user_id: User ID to encode in the token
+        now: Issue time; callers that already read the clock for this
+            request pass it in so iat/exp share one reading
 
     Returns:
         Encoded JWT access token string
     """
-    # SECURITY: Short expiration for access tokens (OWASP: 15-30 minutes)
-    expire = datetime.utcnow() + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    if now is None:
+        now = datetime.utcnow()
 
     # Create token payload with standard JWT claims
+    # SECURITY: Short expiration for access tokens (OWASP: 15-30 minutes)
+    # Claims carry epoch seconds (the JWT NumericDate form) directly, so the
+    # encoder doesn't convert datetimes per call.
+    iat = timegm(now.utctimetuple())
     payload = {
-        "sub": str(user_id),           # Subject (user ID)
-        "exp": expire,                  # Expiration time
-        "iat": datetime.utcnow(),       # Issued at
-        "type": "access"                # Token type for validation
+        **_ACCESS_TEMPLATE,
+        "sub": str(user_id),                         # Subject (user ID)
+        "exp": iat + _ACCESS_TOKEN_TTL_SECONDS,      # Expiration time
+        "iat": iat,                                  # Issued at
     }
 
     # Encode and return token
-    return jwt.encode(
-        payload,
-        settings.BETTER_AUTH_SECRET,
-        algorithm=settings.JWT_ALGORITHM,
-    )
+    if _USE_FAST_HS256:
+        return _sign_hs256(payload)
+    return jwt.encode(payload, _SECRET, algorithm=_ALGORITHM)
 
 
-def create_refresh_token(user_id: int) -> str:
+def create_refresh_token(user_id: int, now: Optional[datetime] = None) -> str:
     """
     Create a JWT refresh token for long-lived sessions.
 
@@ -58,27 +107,27 @@ def create_refresh_token(user_id: int) -> str:
 
     Args:
         user_id: User ID to encode in the token
+        now: Issue time; callers that already read the clock for this
+            request pass it in so iat/exp share one reading
 
     Returns:
         Encoded JWT refresh token string
     """
-    # SECURITY: Longer expiration for refresh tokens (7 days)
-    expire = datetime.utcnow() + timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-    )
+    if now is None:
+        now = datetime.utcnow()
 
+    # SECURITY: Longer expiration for refresh tokens (7 days)
+    iat = timegm(now.utctimetuple())
     payload = {
+        **_REFRESH_TEMPLATE,  # SECURITY: type distinguishes from access tokens
         "sub": str(user_id),
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "refresh"  # SECURITY: Distinguish from access tokens
+        "exp": iat + _REFRESH_TOKEN_TTL_SECONDS,
+        "iat": iat,
     }
 
-    return jwt.encode(
-        payload,
-        settings.BETTER_AUTH_SECRET,
-        algorithm=settings.JWT_ALGORITHM,
-    )
+    if _USE_FAST_HS256:
+        return _sign_hs256(payload)
+    return jwt.encode(payload, _SECRET, algorithm=_ALGORITHM)
 
 
 def verify_refresh_token(token: str) -> Optional[int]:
@@ -98,9 +147,7 @@ def verify_refresh_token(token: str) -> Optional[int]:
     """
     try:
         payload = jwt.decode(
-            token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            token, _SECRET, algorithms=[_ALGORITHM], options=_DECODE_OPTIONS
         )
 
         # SECURITY: Verify token type to prevent access token misuse
@@ -108,45 +155,38 @@ def verify_refresh_token(token: str) -> Optional[int]:
             logger.warning("Invalid token type for refresh operation")
             return None
 
-        user_id = payload.get("sub")
-        if user_id is None:
-            return None
-
-        return int(user_id)
+        # sub presence is enforced by require_sub during decode
+        return int(payload["sub"])
 
     except JWTError as e:
-        logger.warning(f"Refresh token validation failed: {str(e)}")
+        logger.warning("Refresh token validation failed: %s", str(e))
         return None
 
 
-async def check_account_lockout(user: User) -> bool:
+def check_account_lockout(user: User | Row, now: Optional[datetime] = None) -> bool:
     """
     Check if user account is currently locked due to failed login attempts.
 
+    Pure in-memory arithmetic — plain sync so callers on the login path
+    don't pay a coroutine frame and two awaits for a comparison.
+
     Security:
     - Implements account lockout mechanism (OWASP recommendation)
     - Prevents brute-force attacks
-    - Automatic unlock after lockout period expires
+    - Automatic unlock after lockout period expires (locked_until passes)
 
     Args:
-        user: User object to check
+        user: Auth-fields row (or full User) to check
+        now: Current time; passed in by callers that already read the clock
 
     Returns:
         True if account is locked, False otherwise
     """
-    if user.locked_until is None:
-        return False
+    locked_until = user.locked_until
+    return locked_until is not None and (now or datetime.utcnow()) < locked_until
 
-    # Check if lockout period has expired
-    if datetime.utcnow() >= user.locked_until:
-        # SECURITY: Lockout period expired, account is no longer locked
-        return False
 
-    # Account is still locked
-    return True
-
-
-async def reset_failed_login_attempts(session: Session, user: User) -> None:
+async def reset_failed_login_attempts(session: AsyncSession, user: User | Row) -> None:
     """
     Reset failed login attempts counter after successful login.
 
@@ -155,18 +195,39 @@ async def reset_failed_login_attempts(session: Session, user: User) -> None:
     - Removes account lockout
     - Part of rate limiting mechanism
 
+    Performance:
+    - Does not commit: the caller owns the transaction and issues one
+      commit for the whole login, instead of a dedicated commit fence
+      just for the counter reset.
+    - No-op when the counters are already clean, which is the common
+      case — most successful logins follow no failed attempts, and
+      skipping the flush avoids an UPDATE per login.
+
     Args:
         session: Database session
-        user: User object to reset
+        user: Auth-fields row (or full User) identifying the account
     """
-    user.failed_login_attempts = 0
-    user.locked_until = None
-    user.last_failed_login = None
-    session.add(user)
-    session.commit()
+    if (
+        user.failed_login_attempts == 0
+        and user.locked_until is None
+        and user.last_failed_login is None
+    ):
+        return
+
+    # Core UPDATE sidesteps the unit-of-work dirty check and attribute
+    # instrumentation — this only zeroes three columns on one row.
+    statement = (
+        update(User)
+        .where(User.id == user.id)
+        .values(failed_login_attempts=0, locked_until=None, last_failed_login=None)
+    )
+    await session.execute(statement)
+    invalidate_user_cache(user.id)
 
 
-async def increment_failed_login_attempts(session: Session, user: User) -> None:
+async def increment_failed_login_attempts(
+    session: AsyncSession, user: User | Row, now: Optional[datetime] = None
+) -> None:
     """
     Increment failed login attempts and apply account lockout if threshold exceeded.
 
@@ -174,29 +235,59 @@ async def increment_failed_login_attempts(session: Session, user: User) -> None:
     - Tracks failed login attempts (OWASP recommendation)
     - Implements progressive account lockout
     - Prevents brute-force attacks
+    - The counter bump happens in SQL, so concurrent failed logins can't
+      lose updates the way read-modify-write on the loaded object could
 
     Args:
         session: Database session
-        user: User object to update
+        user: Auth-fields row (or full User) identifying the account
+        now: Current time; passed in by callers that already read the clock
     """
-    user.failed_login_attempts += 1
-    user.last_failed_login = datetime.utcnow()
+    if now is None:
+        now = datetime.utcnow()
+    lockout_duration = timedelta(minutes=settings.ACCOUNT_LOCKOUT_MINUTES)
+
+    # PERFORMANCE: the counter bump doesn't need a synchronous WAL flush —
+    # losing the last few attempts in a crash is acceptable, and skipping
+    # the fsync wait keeps a brute-force burst from turning this endpoint
+    # into a commit-fence amplifier. SET LOCAL scopes the relaxation to
+    # this transaction only (safe under PgBouncer transaction pooling).
+    await session.execute(text("SET LOCAL synchronous_commit = off"))
+
+    # Single atomic UPDATE: increment the counter server-side and set the
+    # lockout timestamp in the same statement via CASE, instead of flushing
+    # the whole ORM object. RETURNING brings back the post-increment values
+    # for accurate logging.
+    statement = (
+        update(User)
+        .where(User.id == user.id)
+        .values(
+            failed_login_attempts=User.failed_login_attempts + 1,
+            last_failed_login=now,
+            locked_until=case(
+                (
+                    User.failed_login_attempts + 1 >= settings.MAX_LOGIN_ATTEMPTS,
+                    now + lockout_duration,
+                ),
+                else_=User.locked_until,
+            ),
+        )
+        .returning(User.failed_login_attempts, User.locked_until)
+    )
+    row = (await session.execute(statement)).one()
+    await session.commit()
+    invalidate_user_cache(user.id)
 
-    # SECURITY: Lock account if max attempts exceeded
-    if user.failed_login_attempts >= settings.MAX_LOGIN_ATTEMPTS:
-        lockout_duration = timedelta(minutes=settings.ACCOUNT_LOCKOUT_MINUTES)
-        user.locked_until = datetime.utcnow() + lockout_duration
+    # SECURITY: Log lockouts for monitoring
+    if row.failed_login_attempts >= settings.MAX_LOGIN_ATTEMPTS:
         logger.warning(
-            f"Account locked for user {user.id} due to {user.failed_login_attempts} "
-            f"failed attempts. Locked until {user.locked_until}"
+            "Account locked for user %s due to %s failed attempts. Locked until %s",
+            user.id, row.failed_login_attempts, row.locked_until,
         )
 
-    session.add(user)
-    session.commit()
-
 
 async def authenticate_user(
-    session: Session,
+    session: AsyncSession,
     login_data: UserLogin,
 ) -> dict[str, int | str]:
     """
@@ -219,20 +310,26 @@ async def authenticate_user(
     Raises:
         UnauthorizedError: If credentials are invalid or account is locked
     """
+    # One clock reading serves the whole login: lockout check, failed-attempt
+    # bookkeeping, and the iat/exp claims of both issued tokens.
+    now = datetime.utcnow()
+
     # Normalize email
     email = login_data.email.lower().strip()
 
-    # Get user by email
-    user = await get_user_by_email(session, email)
+    # Columns-only fetch: login reads just the hash and lockout counters,
+    # and the counter writes are id-keyed Core UPDATEs, so the full User
+    # entity is never hydrated on this path.
+    user = await get_user_auth_fields(session, email)
 
     # SECURITY: Use generic error message to prevent email enumeration
     if not user:
-        logger.warning(f"Login attempt with non-existent email: {email}")
+        logger.warning("Login attempt with non-existent email: %s", email)
         raise UnauthorizedError("Invalid email or password")
 
     # SECURITY: Check if account is locked due to failed attempts
-    if await check_account_lockout(user):
-        lockout_remaining = (user.locked_until - datetime.utcnow()).total_seconds() / 60
+    if check_account_lockout(user, now):
+        lockout_remaining = (user.locked_until - now).total_seconds() / 60
         logger.warning(
             f"Login attempt for locked account: {user.id}. "
             f"Locked for {lockout_remaining:.1f} more minutes"
@@ -242,24 +339,41 @@ async def authenticate_user(
             f"Please try again in {int(lockout_remaining) + 1} minutes."
         )
 
-    # SECURITY: Verify password using constant-time comparison
-    if not verify_password(login_data.password, user.password_hash):
-        logger.warning(f"Failed login attempt for user: {user.id}")
+    # SECURITY: Verify password using constant-time comparison.
+    # bcrypt is ~250ms of pure CPU; running it inline would stall the event
+    # loop for every in-flight request, so it goes through the bounded
+    # bcrypt pool like hashing does.
+    if not await run_bcrypt(verify_password, login_data.password, user.password_hash):
+        logger.warning("Failed login attempt for user: %s", user.id)
 
         # SECURITY: Increment failed attempts and potentially lock account
-        await increment_failed_login_attempts(session, user)
+        await increment_failed_login_attempts(session, user, now)
 
         # SECURITY: Generic error message (don't reveal if email exists)
         raise UnauthorizedError("Invalid email or password")
 
-    # SECURITY: Reset failed attempts on successful login
+    # SECURITY: Transparently re-hash passwords minted under an older
+    # BCRYPT_ROUNDS setting, so tuning the work factor migrates existing
+    # accounts at their next login. The hash runs on the bounded bcrypt
+    # pool and the write joins the single commit below.
+    if needs_rehash(user.password_hash):
+        new_hash = await run_bcrypt(hash_password, login_data.password)
+        await session.execute(
+            update(User).where(User.id == user.id).values(password_hash=new_hash)
+        )
+        invalidate_user_cache(user.id)
+
+    # SECURITY: Reset failed attempts on successful login. The helper only
+    # stages the change; the single commit below covers it, so the success
+    # path pays at most one commit round-trip.
     await reset_failed_login_attempts(session, user)
+    await session.commit()
 
     # Create JWT tokens
-    access_token = create_access_token(user.id)
-    refresh_token = create_refresh_token(user.id)
+    access_token = create_access_token(user.id, now)
+    refresh_token = create_refresh_token(user.id, now)
 
-    logger.info(f"User {user.id} logged in successfully")
+    logger.info("User %s logged in successfully", user.id)
 
     return {
         "access_token": access_token,
@@ -270,7 +384,7 @@ async def authenticate_user(
 
 
 async def refresh_access_token(
-    session: Session,
+    session: AsyncSession,
     refresh_token: str,
 ) -> dict[str, str]:
     """
@@ -292,6 +406,9 @@ async def refresh_access_token(
     Raises:
         UnauthorizedError: If refresh token is invalid or user not found
     """
+    # One clock reading serves the lockout check and the new token's claims.
+    now = datetime.utcnow()
+
     # Verify refresh token
     user_id = verify_refresh_token(refresh_token)
 
@@ -304,18 +421,18 @@ async def refresh_access_token(
     user = await get_user_by_id(session, user_id)
 
     if not user:
-        logger.warning(f"Refresh token for non-existent user: {user_id}")
+        logger.warning("Refresh token for non-existent user: %s", user_id)
         raise UnauthorizedError("Invalid refresh token")
 
     # SECURITY: Check if account is locked
-    if await check_account_lockout(user):
-        logger.warning(f"Refresh attempt for locked account: {user_id}")
+    if check_account_lockout(user, now):
+        logger.warning("Refresh attempt for locked account: %s", user_id)
         raise UnauthorizedError("Account is locked")
 
     # Generate new access token
-    new_access_token = create_access_token(user_id)
+    new_access_token = create_access_token(user_id, now)
 
-    logger.info(f"Access token refreshed for user {user_id}")
+    logger.info("Access token refreshed for user %s", user_id)
 
     return {
         "access_token": new_access_token,
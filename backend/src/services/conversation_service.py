@@ -1,6 +1,9 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlalchemy import lambda_stmt, tuple_
+from sqlalchemy.orm import selectinload
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 import logging
 from ..models.conversation import Conversation, Message
 from ..models.mcp_models import ConversationRequest, MessageRequest
@@ -8,7 +11,7 @@ from ..models.mcp_models import ConversationRequest, MessageRequest
 logger = logging.getLogger(__name__)
 
 
-async def create_conversation(session: Session, user_id: int, title: str) -> Conversation:
+async def create_conversation(session: AsyncSession, user_id: int, title: str) -> Conversation:
     """
     Create a new conversation for a user.
 
@@ -25,32 +28,117 @@ async def create_conversation(session: Session, user_id: int, title: str) -> Con
         title=title
     )
     session.add(conversation)
-    session.commit()
-    session.refresh(conversation)
-    logger.info(f"Created conversation {conversation.id} for user {user_id}")
+    # No refresh needed: the INSERT's RETURNING clause populates the id at
+    # flush, all other columns have client-side defaults, and the session
+    # does not expire attributes on commit.
+    await session.commit()
+    logger.info("Created conversation %s for user %s", conversation.id, user_id)
     return conversation
 
 
-async def get_conversations(session: Session, user_id: int) -> List[Conversation]:
+async def get_conversations(
+    session: AsyncSession,
+    user_id: int,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> List[Conversation]:
     """
-    Get all conversations for a user, ordered by creation date (newest first).
+    Get conversations for a user, ordered by creation date (newest first).
+
+    Supports keyset pagination: pass the (created_at, id) of the previous
+    page's last row as `after` and the query seeks straight past it — no
+    OFFSET rows are read and discarded, so page cost is O(limit) at any
+    depth.
 
     Args:
         session: Database session
         user_id: ID of the user
+        limit: Maximum number of conversations to return (None for all)
+        after: (created_at, id) cursor from the previous page's last row
 
     Returns:
         List of conversations
     """
-    statement = select(Conversation).where(Conversation.user_id == user_id).order_by(Conversation.created_at.desc())
-    conversations = session.exec(statement).all()
-    logger.info(f"Retrieved {len(conversations)} conversations for user {user_id}")
-    return list(conversations)
+    # lambda_stmt caches the compiled SQL keyed on statement structure, so
+    # repeat calls skip Core compilation and only rebind parameters (see
+    # db/utils.get_user_tasks for the pattern).
+    statement = lambda_stmt(lambda: select(Conversation))
+    statement += lambda s: s.where(Conversation.user_id == user_id)
+    if after is not None:
+        after_created_at, after_id = after
+        statement += lambda s: s.where(
+            tuple_(Conversation.created_at, Conversation.id) < tuple_(after_created_at, after_id)
+        )
+    statement += lambda s: s.order_by(Conversation.created_at.desc(), Conversation.id.desc())
+    if limit is not None:
+        statement += lambda s: s.limit(limit)
+    conversations = (await session.scalars(statement)).all()
+    logger.info("Retrieved %s conversations for user %s", len(conversations), user_id)
+    return conversations
+
+
+async def get_conversations_with_messages(session: AsyncSession, user_id: int) -> List[Conversation]:
+    """
+    Get a user's conversations with their messages eagerly loaded.
+
+    selectinload batches all messages into one extra query, so rendering a
+    chat list costs two round-trips total instead of one per conversation
+    (the N+1 that lazy access to conversation.messages would fire).
+
+    Args:
+        session: Database session
+        user_id: ID of the user
+
+    Returns:
+        List of conversations, newest first, each with .messages populated
+    """
+    statement = (
+        select(Conversation)
+        .options(selectinload(Conversation.messages))
+        .where(Conversation.user_id == user_id)
+        .order_by(Conversation.created_at.desc())
+    )
+    conversations = (await session.exec(statement)).all()
+    logger.info("Retrieved %s conversations with messages for user %s", len(conversations), user_id)
+    return conversations
 
 
-async def create_message(session: Session, conversation_id: int, role: str, content: str) -> Message:
+async def create_messages(
+    session: AsyncSession, conversation_id: int, items: List[tuple[str, str]]
+) -> List[Message]:
     """
-    Add a message to a conversation.
+    Add a batch of messages to a conversation in one INSERT and one commit.
+
+    A chat turn typically produces several rows at once (user message,
+    assistant reply, sometimes a system note); inserting them per-call
+    costs a round-trip and a commit fence each. add_all lets SQLAlchemy's
+    insertmanyvalues emit a single multi-row INSERT ... RETURNING, which
+    also populates the ids at flush — no refresh needed.
+
+    Args:
+        session: Database session
+        conversation_id: ID of the conversation
+        items: (role, content) pairs in conversation order
+
+    Returns:
+        Created messages, in the order given
+    """
+    messages = [
+        Message(conversation_id=conversation_id, role=role, content=content)
+        for role, content in items
+    ]
+    session.add_all(messages)
+    await session.commit()
+    logger.info("Added %s messages to conversation %s", len(messages), conversation_id)
+    return messages
+
+
+async def create_message(session: AsyncSession, conversation_id: int, role: str, content: str) -> Message:
+    """
+    Add a single message to a conversation.
+
+    Thin wrapper over the batch path; callers with several rows per turn
+    should use create_messages directly.
 
     Args:
         session: Database session
@@ -61,19 +149,11 @@ async def create_message(session: Session, conversation_id: int, role: str, cont
     Returns:
         Created message
     """
-    message = Message(
-        conversation_id=conversation_id,
-        role=role,
-        content=content
-    )
-    session.add(message)
-    session.commit()
-    session.refresh(message)
-    logger.info(f"Added message {message.id} to conversation {conversation_id}")
-    return message
+    messages = await create_messages(session, conversation_id, [(role, content)])
+    return messages[0]
 
 
-async def get_messages(session: Session, conversation_id: int) -> List[Message]:
+async def get_messages(session: AsyncSession, conversation_id: int) -> List[Message]:
     """
     Get all messages for a conversation, ordered by timestamp (oldest first).
 
@@ -84,7 +164,41 @@ async def get_messages(session: Session, conversation_id: int) -> List[Message]:
     Returns:
         List of messages
     """
-    statement = select(Message).where(Message.conversation_id == conversation_id).order_by(Message.timestamp.asc())
-    messages = session.exec(statement).all()
-    logger.info(f"Retrieved {len(messages)} messages for conversation {conversation_id}")
-    return list(messages)
\ No newline at end of file
+    statement = lambda_stmt(lambda: select(Message))
+    statement += lambda s: s.where(Message.conversation_id == conversation_id)
+    statement += lambda s: s.order_by(Message.timestamp.asc())
+    messages = (await session.scalars(statement)).all()
+    logger.info("Retrieved %s messages for conversation %s", len(messages), conversation_id)
+    return messages
+
+
+async def iter_messages(
+    session: AsyncSession, conversation_id: int, batch_size: int = 500
+) -> AsyncIterator[Message]:
+    """
+    Stream a conversation's messages oldest-first in server-side batches.
+
+    get_messages materializes the whole history at once, which is fine
+    for rendering a chat window but doubles memory for export-style
+    consumers of conversations with thousands of messages. This variant
+    streams rows through a server-side cursor, keeping at most
+    batch_size messages resident regardless of history length — feed it
+    to a StreamingResponse for exports.
+
+    Args:
+        session: Database session
+        conversation_id: ID of the conversation
+        batch_size: Rows fetched per round-trip (default: 500)
+
+    Yields:
+        Messages ordered by timestamp (oldest first)
+    """
+    statement = (
+        select(Message)
+        .where(Message.conversation_id == conversation_id)
+        .order_by(Message.timestamp.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    result = await session.stream(statement)
+    async for message in result.scalars():
+        yield message
\ No newline at end of file
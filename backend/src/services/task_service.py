@@ -1,14 +1,49 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlalchemy import Row, delete, lambda_stmt, tuple_, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 import logging
 from ..models.task import Task, TaskCreate, TaskUpdate
 from ..core.exceptions import NotFoundError, ForbiddenError
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by the write paths' RETURNING clauses — the same
+# projection get_tasks uses, so callers serialize rows identically.
+_TASK_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.due_date,
+    Task.is_complete,
+    Task.user_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+async def _raise_for_missing_row(session: AsyncSession, task_id: int, user_id: int) -> None:
+    """
+    Distinguish not-found from not-owned after a zero-row write.
+
+    The write statements filter on id AND user_id, so a miss is ambiguous.
+    One cheap single-column lookup resolves it — and only runs on the
+    error path, keeping the happy path at a single round-trip.
+
+    Raises:
+        NotFoundError: If no task with that id exists
+        ForbiddenError: If the task belongs to another user
+    """
+    owner_id = (await session.exec(select(Task.user_id).where(Task.id == task_id))).first()
+    if owner_id is None:
+        logger.warning("Task %s not found", task_id)
+        raise NotFoundError(f"Task with id {task_id} not found")
+    logger.warning("User %s attempted to access task %s owned by user %s", user_id, task_id, owner_id)
+    raise ForbiddenError("You don't have permission to access this task")
 
-async def create_task(session: Session, task_data: TaskCreate, user_id: int) -> Task:
+
+async def create_task(session: AsyncSession, task_data: TaskCreate, user_id: int) -> Task:
     """
     Create a new task for a user.
 
@@ -30,41 +65,92 @@ async def create_task(session: Session, task_data: TaskCreate, user_id: int) ->
         user_id=user_id,
     )
     session.add(task)
-    session.commit()
-    session.refresh(task)
-    logger.info(f"Created task {task.id} for user {user_id}")
+    # No refresh needed: the INSERT's RETURNING clause populates the id at
+    # flush, all other columns have client-side defaults, and the session
+    # does not expire attributes on commit.
+    await session.commit()
+    logger.info("Created task %s for user %s", task.id, user_id)
     return task
 
 
-async def get_tasks(session: Session, user_id: int, include_completed: bool = True, limit: int = 50, offset: int = 0) -> List[Task]:
+async def get_tasks(
+    session: AsyncSession,
+    user_id: int,
+    include_completed: bool = True,
+    limit: int = 50,
+    offset: int = 0,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> Sequence[Row]:
     """
     Get tasks for a user with optional filtering, ordered by creation date (newest first).
 
+    Pagination is keyset-based when a cursor is given: `after` is the
+    (created_at, id) of the last row of the previous page, and the query
+    seeks directly past it via a row-value comparison instead of reading
+    and discarding `offset` rows. Cost stays O(limit) at any page depth.
+    `offset` remains for callers without a cursor, but is ignored when
+    `after` is set.
+
     Args:
         session: Database session
         user_id: ID of the user
         include_completed: Whether to include completed tasks (default: True)
         limit: Maximum number of tasks to return (default: 50)
-        offset: Number of tasks to skip (default: 0)
+        offset: Number of tasks to skip when no cursor is given (default: 0)
+        after: (created_at, id) cursor from the previous page's last row
 
     Returns:
-        List of tasks
+        List of task rows (attribute access like ORM objects, but no ORM
+        instance construction or identity-map bookkeeping — the rows exist
+        only to be serialized into TaskResponse). The next page's cursor is
+        (rows[-1].created_at, rows[-1].id).
     """
-    statement = select(Task).where(Task.user_id == user_id)
-    
+    # Project exactly the columns the API response carries. Core rows skip
+    # per-row ORM object construction, and pydantic validates them through
+    # from_attributes just like entities.
+    #
+    # lambda_stmt caches the compiled SQL keyed on statement structure
+    # (one cache entry per branch combination), so repeat calls skip Core
+    # compilation and only rebind parameters — client-side only, since
+    # PgBouncer in transaction mode forbids server-side prepared
+    # statements.
+    statement = lambda_stmt(lambda: select(
+        Task.id,
+        Task.title,
+        Task.description,
+        Task.due_date,
+        Task.is_complete,
+        Task.user_id,
+        Task.created_at,
+        Task.updated_at,
+    ))
+    statement += lambda s: s.where(Task.user_id == user_id)
+
     # Apply completion filter if needed
     if not include_completed:
-        statement = statement.where(Task.is_complete == False)
-    
-    # Order by creation date (newest first) and apply limits
-    statement = statement.order_by(Task.created_at.desc()).offset(offset).limit(limit)
-    
-    tasks = session.exec(statement).all()
-    logger.info(f"Retrieved {len(tasks)} tasks for user {user_id} with filters: include_completed={include_completed}, limit={limit}, offset={offset}")
-    return list(tasks)
+        statement += lambda s: s.where(Task.is_complete == False)
+
+    if after is not None:
+        # Seek past the cursor row. The id tiebreaker makes the ordering
+        # total, so rows sharing a created_at are never skipped or repeated
+        # across pages.
+        after_created_at, after_id = after
+        statement += lambda s: s.where(
+            tuple_(Task.created_at, Task.id) < tuple_(after_created_at, after_id)
+        )
+    elif offset:
+        statement += lambda s: s.offset(offset)
+
+    statement += lambda s: s.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+
+    # execute() rather than exec(): sqlmodel's exec special-cases Select
+    # objects, which a StatementLambdaElement is not.
+    tasks = (await session.execute(statement)).all()
+    logger.info("Retrieved %s tasks for user %s with filters: include_completed=%s, limit=%s, after=%s", len(tasks), user_id, include_completed, limit, after)
+    return tasks
 
 
-async def get_task_by_id(session: Session, task_id: int, user_id: int) -> Task:
+async def get_task_by_id(session: AsyncSession, task_id: int, user_id: int) -> Task:
     """
     Get a specific task by ID with ownership verification.
 
@@ -80,22 +166,30 @@ async def get_task_by_id(session: Session, task_id: int, user_id: int) -> Task:
         NotFoundError: If task not found
         ForbiddenError: If task doesn't belong to user
     """
-    task = session.get(Task, task_id)
+    # session.get consults the session's identity map first, so repeated
+    # lookups of the same task within one request/transaction are free.
+    # The mutate paths (update/toggle/delete) don't call this at all —
+    # their ownership check lives in the write statement's WHERE clause.
+    task = await session.get(Task, task_id)
 
     if not task:
-        logger.warning(f"Task {task_id} not found")
+        logger.warning("Task %s not found", task_id)
         raise NotFoundError(f"Task with id {task_id} not found")
 
     if task.user_id != user_id:
-        logger.warning(f"User {user_id} attempted to access task {task_id} owned by user {task.user_id}")
+        logger.warning("User %s attempted to access task %s owned by user %s", user_id, task_id, task.user_id)
         raise ForbiddenError("You don't have permission to access this task")
 
     return task
 
 
-async def update_task(session: Session, task_id: int, task_data: TaskUpdate, user_id: int) -> Task:
+async def update_task(session: AsyncSession, task_id: int, task_data: TaskUpdate, user_id: int) -> Row:
     """
-    Update a task with ownership verification.
+    Update a task with ownership verification in a single round-trip.
+
+    The ownership check is folded into the UPDATE's WHERE clause and the
+    new state comes back via RETURNING, replacing the previous
+    SELECT + UPDATE + refresh (three round-trips) with one.
 
     Args:
         session: Database session
@@ -104,32 +198,36 @@ async def update_task(session: Session, task_id: int, task_data: TaskUpdate, use
         user_id: ID of the user
 
     Returns:
-        Updated task
+        Updated task row
 
     Raises:
         NotFoundError: If task not found
         ForbiddenError: If task doesn't belong to user
     """
-    task = await get_task_by_id(session, task_id, user_id)
-
     # Update only provided fields (partial update)
     update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
 
-    # Always update the timestamp
-    task.updated_at = datetime.utcnow()
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**update_data)
+        .returning(*_TASK_COLUMNS)
+    )
+    row = (await session.execute(statement)).first()
+    if row is None:
+        await _raise_for_missing_row(session, task_id, user_id)
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-    logger.info(f"Updated task {task_id} for user {user_id}")
-    return task
+    await session.commit()
+    logger.info("Updated task %s for user %s", task_id, user_id)
+    return row
 
 
-async def delete_task(session: Session, task_id: int, user_id: int) -> None:
+async def delete_task(session: AsyncSession, task_id: int, user_id: int) -> None:
     """
-    Delete a task with ownership verification.
+    Delete a task with ownership verification in a single round-trip.
+
+    Ownership is checked by the DELETE's WHERE clause itself; no prior
+    SELECT is needed.
 
     Args:
         session: Database session
@@ -140,34 +238,45 @@ async def delete_task(session: Session, task_id: int, user_id: int) -> None:
         NotFoundError: If task not found
         ForbiddenError: If task doesn't belong to user
     """
-    task = await get_task_by_id(session, task_id, user_id)
-    session.delete(task)
-    session.commit()
-    logger.info(f"Deleted task {task_id} for user {user_id}")
+    statement = delete(Task).where(Task.id == task_id, Task.user_id == user_id)
+    result = await session.execute(statement)
+    if result.rowcount == 0:
+        await _raise_for_missing_row(session, task_id, user_id)
 
+    await session.commit()
+    logger.info("Deleted task %s for user %s", task_id, user_id)
 
-async def toggle_complete(session: Session, task_id: int, user_id: int) -> Task:
+
+async def toggle_complete(session: AsyncSession, task_id: int, user_id: int) -> Row:
     """
     Toggle task completion status with ownership verification.
 
+    The flip happens server-side (is_complete = NOT is_complete) so no
+    read precedes the write; RETURNING hands back the new state in the
+    same round-trip.
+
     Args:
         session: Database session
         task_id: ID of the task
         user_id: ID of the user
 
     Returns:
-        Updated task with toggled completion status
+        Updated task row with toggled completion status
 
     Raises:
         NotFoundError: If task not found
         ForbiddenError: If task doesn't belong to user
     """
-    task = await get_task_by_id(session, task_id, user_id)
-    task.is_complete = not task.is_complete
-    task.updated_at = datetime.utcnow()
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(is_complete=~Task.is_complete)
+        .returning(*_TASK_COLUMNS)
+    )
+    row = (await session.execute(statement)).first()
+    if row is None:
+        await _raise_for_missing_row(session, task_id, user_id)
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-    logger.info(f"Toggled task {task_id} completion to {task.is_complete} for user {user_id}")
-    return task
+    await session.commit()
+    logger.info("Toggled task %s completion to %s for user %s", task_id, row.is_complete, user_id)
+    return row
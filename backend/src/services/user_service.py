@@ -1,14 +1,92 @@
 from sqlmodel import Session, select
+from sqlalchemy import Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+import asyncio
+import base64
 import bcrypt
-import logging
-import secrets
 import hmac
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from ..models.user import User, UserCreate
 from ..core.exceptions import ValidationError
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# SECURITY/PERFORMANCE: bcrypt with 12 rounds takes ~250ms of pure CPU.
+# Running it inline would block the event loop; running it on an unbounded
+# threadpool lets a burst of registrations/logins saturate every core.
+# A small dedicated pool bounds CPU usage, and the semaphore provides
+# backpressure so excess requests queue in the event loop (cheap) instead
+# of piling up work items in the executor.
+#
+# Threads, not processes: the bcrypt C extension releases the GIL while
+# hashing, so a thread pool already scales across cores without the
+# pickling and per-process memory cost of a ProcessPoolExecutor. Sized to
+# the machine but capped so a big host still keeps cores free for the
+# event loop and other uvicorn workers.
+_BCRYPT_WORKERS = min(4, os.cpu_count() or 1)
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=_BCRYPT_WORKERS, thread_name_prefix="bcrypt"
+)
+_bcrypt_semaphore = asyncio.Semaphore(_BCRYPT_WORKERS * 2)
+
+# Bound once at import; read on every hash (see auth_service for rationale).
+_BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# SECURITY: optional pepper, mixed in via HMAC-SHA256 before bcrypt. The
+# pre-hash is effectively free (OpenSSL dispatches to SHA-NI on modern
+# CPUs) and as a bonus lifts bcrypt's 72-byte input limit, since bcrypt
+# only ever sees the fixed-size digest. Empty pepper keeps the legacy
+# raw-password path so existing hashes still verify.
+_PEPPER = settings.PASSWORD_PEPPER.encode()
+
+
+def _password_bytes(password: str) -> bytes:
+    """Bytes actually fed to bcrypt: peppered digest, or raw truncated UTF-8."""
+    if _PEPPER:
+        # base64 rather than the raw digest: bcrypt's C implementation
+        # treats NUL as a terminator, and a raw SHA-256 digest can contain
+        # one. 44 base64 bytes sit safely under the 72-byte limit.
+        digest = hmac.new(_PEPPER, password.encode('utf-8'), 'sha256').digest()
+        return base64.b64encode(digest)
+    # SECURITY: bcrypt has a 72-byte limit, truncate if necessary
+    return password.encode('utf-8')[:72]
+
+# Short-TTL cache for id-keyed user lookups (refresh-token path). Entries are
+# detached User instances; sessions don't expire attributes on commit, so
+# plain reads on them are safe. Writes to auth columns call
+# invalidate_user_cache so a lockout is never masked longer than one fetch.
+# The per-request auth middleware is JWT-only and never hits this.
+_USER_CACHE_TTL = 60.0
+_USER_CACHE_MAX = 10_000
+_user_cache: dict[int, tuple[float, User]] = {}
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop the cached entry for a user after any auth-relevant write."""
+    _user_cache.pop(user_id, None)
+
+
+
+async def run_bcrypt(func, *args):
+    """
+    Run a bcrypt operation on the bounded worker pool with backpressure.
+
+    Args:
+        func: Sync bcrypt-bound callable (hash_password / verify_password)
+        *args: Arguments forwarded to the callable
+
+    Returns:
+        The callable's result
+    """
+    async with _bcrypt_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_bcrypt_executor, func, *args)
+
 
 def hash_password(password: str) -> str:
     """
@@ -18,6 +96,7 @@ def hash_password(password: str) -> str:
     - Uses bcrypt with minimum 12 rounds (configurable via settings)
     - Automatically generates cryptographically secure salt
     - Resistant to rainbow table attacks
+    - Optional HMAC-SHA256 pepper applied first (see _password_bytes)
     - Handles 72-byte bcrypt limit by truncating if necessary
 
     Args:
@@ -26,11 +105,10 @@ def hash_password(password: str) -> str:
     Returns:
         Bcrypt hashed password string
     """
-    # SECURITY: bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = password.encode('utf-8')[:72]
+    password_bytes = _password_bytes(password)
 
     # Generate salt with configured rounds (OWASP minimum: 12)
-    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
 
     # Hash the password
     hashed = bcrypt.hashpw(password_bytes, salt)
@@ -39,6 +117,28 @@ def hash_password(password: str) -> str:
     return hashed.decode('utf-8')
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Report whether a stored hash predates the configured bcrypt cost.
+
+    Bcrypt encodes its cost factor in the hash ($2b$<cost>$...), so a
+    cheap string parse tells us when a hash was minted under an older
+    BCRYPT_ROUNDS setting. Login re-hashes such passwords transparently,
+    keeping per-login CPU tunable from config without a migration.
+
+    Args:
+        hashed_password: Stored bcrypt hash
+
+    Returns:
+        True if the hash should be regenerated at the configured cost
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != _BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        # Unparseable hash: leave it alone; verification will fail anyway.
+        return False
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password using constant-time comparison.
@@ -57,16 +157,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     try:
         # SECURITY: bcrypt.checkpw uses constant-time comparison internally
-        password_bytes = plain_password.encode('utf-8')[:72]
+        password_bytes = _password_bytes(plain_password)
         hashed_bytes = hashed_password.encode('utf-8')
         return bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception as e:
         # Log error but don't expose details to caller
-        logger.error(f"Password verification error: {str(e)}")
+        logger.error("Password verification error: %s", str(e))
         return False
 
 
-def create_user_sync(session: Session, user_data: UserCreate) -> User:
+def _insert_user_statement(email: str, password_hash: str):
+    """
+    Build the atomic registration INSERT shared by both create paths.
+
+    ON CONFLICT (email) DO NOTHING folds the duplicate check into the
+    INSERT itself: no row back means the email exists. This is one
+    round-trip instead of SELECT-then-INSERT, and closes the race where
+    two concurrent registrations both pass the SELECT and one then dies
+    on the unique constraint.
+    """
+    return (
+        pg_insert(User)
+        .values(email=email, password_hash=password_hash)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id, User.email, User.created_at)
+    )
+
+
+def create_user_sync(session: Session, user_data: UserCreate) -> Row:
     """
     Create a new user with hashed password.
 
@@ -75,7 +193,7 @@ def create_user_sync(session: Session, user_data: UserCreate) -> User:
         user_data: User registration data (email and password)
 
     Returns:
-        Created user object
+        Row with (id, email, created_at) of the created user
 
     Raises:
         ValidationError: If email already exists or validation fails
@@ -83,111 +201,130 @@ def create_user_sync(session: Session, user_data: UserCreate) -> User:
     # Normalize email to lowercase
     email = user_data.email.lower().strip()
 
-    # Check if email already exists
-    existing_user = session.exec(
-        select(User).where(User.email == email)
-    ).first()
-
-    if existing_user:
-        logger.warning(f"Registration attempt with existing email: {email}")
-        raise ValidationError("Email already registered")
-
     # Hash the password
     hashed_password = hash_password(user_data.password)
 
-    # Create new user
-    user = User(
-        email=email,
-        password_hash=hashed_password,
-    )
-
-    # Debug logging
-    logger.info(f"Creating user with email: {email}")
-    
-    session.add(user)
-    logger.info("Added user to session")
-    
+    row = session.execute(_insert_user_statement(email, hashed_password)).first()
+    if row is None:
+        session.rollback()
+        logger.warning("Registration attempt with existing email: %s", email)
+        raise ValidationError("Email already registered")
     session.commit()
-    logger.info("Committed transaction")
-    
-    session.refresh(user)
-    logger.info(f"Refreshed user, ID: {user.id}")
 
-    logger.info(f"User created successfully: {user.id} ({email})")
-    return user
+    logger.info("User created successfully: %s (%s)", row.id, email)
+    return row
 
 
-async def create_user(session: Session, user_data: UserCreate) -> User:
+async def create_user(session: AsyncSession, user_data: UserCreate) -> Row:
     """
-    Async wrapper for create_user_sync to maintain compatibility.
-    
+    Create a new user, hashing the password on the bounded bcrypt pool.
+
+    Unlike create_user_sync, the expensive bcrypt hash runs off the event
+    loop via run_bcrypt so concurrent registrations don't stall other
+    requests. The duplicate check rides on the INSERT's ON CONFLICT
+    clause, so registration is a single atomic round-trip.
+
     Args:
         session: Database session
         user_data: User registration data (email and password)
 
     Returns:
-        Created user object
+        Row with (id, email, created_at) of the created user
 
     Raises:
         ValidationError: If email already exists or validation fails
     """
-    # For sync database operations, we can call the sync version directly
-    # This avoids potential issues with async/await and database transactions
-    return create_user_sync(session, user_data)
-
+    # Normalize email to lowercase
+    email = user_data.email.lower().strip()
 
-def get_user_by_email_sync(session: Session, email: str) -> User | None:
-    """
-    Get a user by email (case-insensitive).
+    # Hash the password on the bounded worker pool (CPU-heavy). Hashing
+    # happens before the duplicate is detected now, but duplicate
+    # registrations are rare and the constant-time behavior is a mild
+    # anti-enumeration bonus.
+    hashed_password = await run_bcrypt(hash_password, user_data.password)
 
-    Args:
-        session: Database session
-        email: User email
+    row = (await session.execute(_insert_user_statement(email, hashed_password))).first()
+    if row is None:
+        await session.rollback()
+        logger.warning("Registration attempt with existing email: %s", email)
+        raise ValidationError("Email already registered")
+    await session.commit()
 
-    Returns:
-        User object if found, None otherwise
-    """
-    email = email.lower().strip()
-    return session.exec(select(User).where(User.email == email)).first()
+    logger.info("User created successfully: %s (%s)", row.id, email)
+    return row
 
 
-async def get_user_by_email(session: Session, email: str) -> User | None:
+async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
     """
-    Async wrapper for get_user_by_email_sync to maintain compatibility.
+    Get a user by email (case-insensitive) using the async session.
 
     Args:
-        session: Database session
+        session: Async database session
         email: User email
 
     Returns:
         User object if found, None otherwise
     """
-    return get_user_by_email_sync(session, email)
+    email = email.lower().strip()
+    return (await session.exec(select(User).where(User.email == email))).first()
 
 
-def get_user_by_id_sync(session: Session, user_id: int) -> User | None:
+async def get_user_auth_fields(session: AsyncSession, email: str) -> Row | None:
     """
-    Get a user by ID.
+    Fetch only the columns the login path reads, keyed by email.
+
+    The authentication flow needs the password hash and the lockout
+    counters, nothing else; a columns-only select skips full-entity
+    hydration and attribute instrumentation on the hottest auth query.
+    Writes to the counters go through Core UPDATEs keyed on id, so the
+    hydrated User entity is never needed during login.
 
     Args:
-        session: Database session
-        user_id: User ID
+        session: Async database session
+        email: User email (already normalized by the caller)
 
     Returns:
-        User object if found, None otherwise
+        Row with (id, email, password_hash, failed_login_attempts,
+        locked_until, last_failed_login) if found, None otherwise
     """
-    return session.get(User, user_id)
-
-
-async def get_user_by_id(session: Session, user_id: int) -> User | None:
+    statement = select(
+        User.id,
+        User.email,
+        User.password_hash,
+        User.failed_login_attempts,
+        User.locked_until,
+        User.last_failed_login,
+    ).where(User.email == email)
+    return (await session.exec(statement)).first()
+
+
+async def get_user_by_id(session: AsyncSession, user_id: int) -> User | None:
     """
-    Async wrapper for get_user_by_id_sync to maintain compatibility.
+    Get a user by ID using the async session, with a short-TTL cache.
+
+    Cache hits skip the round-trip entirely; misses and expired entries
+    fall through to the database. Only id-keyed reads are cached — the
+    email-keyed login lookup always needs fresh lockout counters.
 
     Args:
-        session: Database session
+        session: Async database session
         user_id: User ID
 
     Returns:
         User object if found, None otherwise
     """
-    return get_user_by_id_sync(session, user_id)
+    now = time.monotonic()
+    entry = _user_cache.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    user = await session.get(User, user_id)
+    if user is not None:
+        if len(_user_cache) >= _USER_CACHE_MAX:
+            expired = [k for k, (deadline, _) in _user_cache.items() if deadline <= now]
+            for k in expired:
+                del _user_cache[k]
+            if len(_user_cache) >= _USER_CACHE_MAX:
+                _user_cache.clear()
+        _user_cache[user_id] = (now + _USER_CACHE_TTL, user)
+    return user